@@ -20,10 +20,20 @@ CREATE TABLE IF NOT EXISTS transcript_segments (
     episode_id INTEGER REFERENCES episodes(id),
     speaker TEXT NOT NULL,
     text TEXT NOT NULL,
-    embedding vector(1536)
+    -- Half-precision storage (pgvector >= 0.7): half the size of vector(1536)
+    -- with negligible loss of top-k recall
+    embedding halfvec(1536),
+    -- Position of the segment within its episode; lets re-runs upsert in place
+    segment_index INTEGER NOT NULL,
+    UNIQUE (episode_id, segment_index)
 );
 
 -- Create indexes for better performance
-CREATE INDEX IF NOT EXISTS idx_transcript_segments_episode_id ON transcript_segments(episode_id);
+-- The (episode_id, segment_index) unique index already serves episode_id lookups
+DROP INDEX IF EXISTS idx_transcript_segments_episode_id;
 CREATE INDEX IF NOT EXISTS idx_transcript_segments_speaker ON transcript_segments(speaker);
 CREATE INDEX IF NOT EXISTS idx_episodes_episode_number ON episodes(episode_number);
+
+-- Approximate nearest-neighbour index for cosine similarity search
+CREATE INDEX IF NOT EXISTS idx_transcript_segments_embedding_hnsw ON transcript_segments
+    USING hnsw (embedding halfvec_cosine_ops) WITH (m = 16, ef_construction = 64);
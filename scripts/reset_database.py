@@ -2,10 +2,12 @@
 """
 Database reset script for gent_disagreement_rag.
 
-This script drops all tables and recreates the database schema.
+By default this script truncates all tables and re-seeds the episodes.
+Pass --full to drop all tables and recreate the schema from the migrations.
 Use with caution as this will delete all data!
 """
 
+import argparse
 import logging
 import sys
 from pathlib import Path
@@ -26,34 +28,88 @@ def setup_logging() -> None:
     )
 
 
-def reset_database(db_manager: DatabaseManager) -> None:
-    """Reset the database by dropping and recreating all tables."""
+# Drop tables in reverse dependency order
+DROP_TABLES_SQL = """
+DROP TABLE IF EXISTS transcript_segments CASCADE;
+DROP TABLE IF EXISTS episodes CASCADE;
+"""
+
+
+# Reset is re-runnable against a development database, so skip the WAL flush on
+# commit and give the migrations' index builds more memory. SET LOCAL reverts
+# both when the transaction ends. Do not copy this into production code paths.
+RESET_SETTINGS_SQL = """
+SET LOCAL synchronous_commit = OFF;
+SET LOCAL maintenance_work_mem = '512MB';
+"""
+
+
+# Clear every table and reset their id sequences, keeping the schema intact
+TRUNCATE_TABLES_SQL = """
+TRUNCATE TABLE transcript_segments, episodes RESTART IDENTITY CASCADE;
+"""
+
+
+def reset_data(db_manager: DatabaseManager) -> None:
+    """Reset the database contents without touching the schema.
+
+    The truncate and episode seed share one transaction, so other sessions
+    never observe the tables empty.
+    """
     logger = logging.getLogger(__name__)
 
+    from .seed_database import copy_episode_seed
+
     conn = db_manager.get_connection()
     cur = conn.cursor()
 
     try:
-        logger.warning("Dropping all tables...")
+        logger.warning("Truncating all tables...")
+        cur.execute(RESET_SETTINGS_SQL + TRUNCATE_TABLES_SQL)
+
+        logger.info("Reseeding episodes data...")
+        inserted = copy_episode_seed(cur)
+
+        conn.commit()
+        logger.info(f"Database data reset completed successfully! ({inserted} episodes)")
+
+    except Exception as e:
+        logger.error(f"Error resetting database data: {e}")
+        conn.rollback()
+        raise
+    finally:
+        cur.close()
+        db_manager.put_connection(conn)
+
+
+def reset_schema(db_manager: DatabaseManager) -> None:
+    """Reset the database by dropping and recreating all tables.
+
+    The drops, migrations and episode seed run in a single transaction, so a
+    failed reset leaves the previous schema and data in place.
+    """
+    logger = logging.getLogger(__name__)
+
+    from .seed_database import copy_episode_seed, load_migration_sql
+
+    migration_sql = load_migration_sql()
+
+    conn = db_manager.get_connection()
+    cur = conn.cursor()
 
-        # Drop tables in reverse dependency order
-        cur.execute("DROP TABLE IF EXISTS transcript_segments CASCADE;")
-        cur.execute("DROP TABLE IF EXISTS episodes CASCADE;")
+    try:
+        logger.warning("Dropping all tables and recreating database schema...")
 
         # Drop the vector extension (optional, as it might be used by other databases)
         # cur.execute("DROP EXTENSION IF EXISTS vector CASCADE;")
 
-        conn.commit()
-        logger.info("All tables dropped successfully!")
-
-        # Recreate schema and reseed data
-        logger.info("Recreating database schema and data...")
-        from .seed_database import create_schema, seed_episodes
+        cur.execute(RESET_SETTINGS_SQL + DROP_TABLES_SQL + migration_sql)
 
-        create_schema(db_manager)
-        seed_episodes(db_manager)
+        logger.info("Reseeding episodes data...")
+        inserted = copy_episode_seed(cur)
 
-        logger.info("Database reset completed successfully!")
+        conn.commit()
+        logger.info(f"Database reset completed successfully! ({inserted} episodes)")
 
     except Exception as e:
         logger.error(f"Error resetting database: {e}")
@@ -61,11 +117,19 @@ def reset_database(db_manager: DatabaseManager) -> None:
         raise
     finally:
         cur.close()
-        conn.close()
+        db_manager.put_connection(conn)
 
 
 def main() -> None:
     """Main function to reset the database."""
+    parser = argparse.ArgumentParser(description="Reset the gent_disagreement_rag database.")
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="drop all tables and rerun the migrations instead of truncating",
+    )
+    args = parser.parse_args()
+
     setup_logging()
     logger = logging.getLogger(__name__)
 
@@ -87,7 +151,10 @@ def main() -> None:
         db_manager = DatabaseManager()
 
         # Reset database
-        reset_database(db_manager)
+        if args.full:
+            reset_schema(db_manager)
+        else:
+            reset_data(db_manager)
 
         logger.info("Database reset completed successfully!")
 
@@ -8,7 +8,9 @@ It can be run independently of the main application.
 
 import logging
 import sys
+from functools import lru_cache
 from pathlib import Path
+from typing import Tuple
 
 # Add the src directory to the Python path
 project_root = Path(__file__).parent.parent
@@ -16,6 +18,13 @@ sys.path.insert(0, str(project_root / "src"))
 
 from gent_disagreement_rag.core.database_manager import DatabaseManager
 
+MIGRATIONS_DIR = Path(__file__).parent / "migrations"
+
+# Seed manifest with one row per episode, stored alongside the migrations
+EPISODE_SEED_FILE = MIGRATIONS_DIR / "002_seed_episodes.csv"
+
+EPISODE_SEED_COLUMNS = "episode_number, title, file_name, date_published"
+
 
 def setup_logging() -> None:
     """Configure logging for the script."""
@@ -26,13 +35,20 @@ def setup_logging() -> None:
     )
 
 
-def create_schema(db_manager: DatabaseManager) -> None:
-    """Create the database schema by running migration files."""
-    logger = logging.getLogger(__name__)
-    logger.info("Creating database schema...")
+@lru_cache(maxsize=4)
+def _read_migration_files(migration_files: Tuple[Tuple[str, int], ...]) -> str:
+    """Concatenate migration files; keyed on (path, mtime) so edits invalidate it."""
+    return "\n;\n".join(
+        Path(path).read_text(encoding="utf-8") for path, _mtime_ns in migration_files
+    )
 
-    # Get the migrations directory (in the same directory as this script)
-    migrations_dir = Path(__file__).parent / "migrations"
+
+def load_migration_sql(migrations_dir: Path = MIGRATIONS_DIR) -> str:
+    """Read every migration file, in order, into a single SQL script.
+
+    File contents are cached in memory until a migration is added or modified.
+    """
+    logger = logging.getLogger(__name__)
 
     if not migrations_dir.exists():
         raise FileNotFoundError(f"Migrations directory not found: {migrations_dir}")
@@ -40,31 +56,69 @@ def create_schema(db_manager: DatabaseManager) -> None:
     # Get all SQL migration files and sort them
     migration_files = sorted([f for f in migrations_dir.glob("*.sql")])
 
-    if not migration_files:
-        logger.warning("No migration files found")
-        return
+    for migration_file in migration_files:
+        logger.info(f"Running migration: {migration_file.name}")
 
-    conn = db_manager.get_connection()
-    cur = conn.cursor()
+    return _read_migration_files(
+        tuple((str(f), f.stat().st_mtime_ns) for f in migration_files)
+    )
 
-    try:
-        for migration_file in migration_files:
-            logger.info(f"Running migration: {migration_file.name}")
 
-            with open(migration_file, "r") as f:
-                migration_sql = f.read()
+def create_schema(db_manager: DatabaseManager) -> None:
+    """Create the database schema by running migration files."""
+    logger = logging.getLogger(__name__)
+    logger.info("Creating database schema...")
+
+    migration_sql = load_migration_sql()
 
+    if not migration_sql:
+        logger.warning("No migration files found")
+        return
+
+    with db_manager.connection() as conn, conn.cursor() as cur:
+        try:
+            # Send every migration to the server in a single round trip
             cur.execute(migration_sql)
 
-        conn.commit()
-        logger.info("All migrations completed successfully!")
-    except Exception as e:
-        logger.error(f"Error running migrations: {e}")
-        conn.rollback()
-        raise
-    finally:
-        cur.close()
-        conn.close()
+            conn.commit()
+            logger.info("All migrations completed successfully!")
+        except Exception as e:
+            logger.error(f"Error running migrations: {e}")
+            conn.rollback()
+            raise
+
+
+def copy_episode_seed(cur) -> int:
+    """Merge the seed manifest into ``episodes`` on an open cursor.
+
+    Rows are streamed with COPY into a transaction-scoped staging table and
+    then merged into ``episodes`` so existing episode numbers are left as-is.
+    Does not commit; returns the number of newly inserted episodes.
+    """
+    cur.execute(
+        f"""
+        CREATE TEMP TABLE episodes_seed ON COMMIT DROP AS
+        SELECT {EPISODE_SEED_COLUMNS} FROM episodes WITH NO DATA;
+        """
+    )
+    if not EPISODE_SEED_FILE.exists():
+        raise FileNotFoundError(f"Episode seed file not found: {EPISODE_SEED_FILE}")
+
+    # Stream the manifest as-is; the server parses the CSV and its header row
+    with open(EPISODE_SEED_FILE, "rb") as seed_file:
+        cur.copy_expert(
+            f"COPY episodes_seed ({EPISODE_SEED_COLUMNS}) FROM STDIN "
+            "WITH (FORMAT csv, HEADER true, ENCODING 'UTF8')",
+            seed_file,
+        )
+    cur.execute(
+        f"""
+        INSERT INTO episodes ({EPISODE_SEED_COLUMNS})
+        SELECT {EPISODE_SEED_COLUMNS} FROM episodes_seed
+        ON CONFLICT (episode_number) DO NOTHING;
+        """
+    )
+    return cur.rowcount
 
 
 def seed_episodes(db_manager: DatabaseManager) -> None:
@@ -72,34 +126,16 @@ def seed_episodes(db_manager: DatabaseManager) -> None:
     logger = logging.getLogger(__name__)
     logger.info("Seeding episodes data...")
 
-    conn = db_manager.get_connection()
-    cur = conn.cursor()
+    with db_manager.connection() as conn, conn.cursor() as cur:
+        try:
+            inserted = copy_episode_seed(cur)
 
-    try:
-        cur.execute(
-            """
-            INSERT INTO episodes (
-                episode_number,
-                title,
-                file_name, 
-                date_published
-            ) VALUES 
-                ('180', 'A SCOTUS ''24-''25" term review with Professor Jack Beermann', 'AGD-180.mp3', '2025-08-12'),
-                ('181', 'Six in Sixty: creeping authoritarianism', 'AGD-181.mp3', '2025-08-26'),
-                ('182', 'How tariffs are affecting the global economy and geopolitics with Lydia DePillis', 'AGD-182.mp3', '2025-02-09'),
-            ON CONFLICT (episode_number) DO NOTHING;
-            """
-        )
-
-        conn.commit()
-        logger.info("Episodes data seeded successfully!")
-    except Exception as e:
-        logger.error(f"Error seeding episodes: {e}")
-        conn.rollback()
-        raise
-    finally:
-        cur.close()
-        conn.close()
+            conn.commit()
+            logger.info(f"Episodes data seeded successfully! ({inserted} new)")
+        except Exception as e:
+            logger.error(f"Error seeding episodes: {e}")
+            conn.rollback()
+            raise
 
 
 def main() -> None:
@@ -1,9 +1,13 @@
 """Configuration module for episode management."""
 
 import json
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import List, TypedDict
 
+from dotenv import load_dotenv
+
 
 class Episode(TypedDict):
     """Type definition for episode configuration."""
@@ -14,6 +18,9 @@ class Episode(TypedDict):
     processed: bool
 
 
+EPISODES_PATH = Path(__file__).parent / "episodes.json"
+
+
 def load_episodes() -> List[Episode]:
     """
     Load episode configuration from episodes.json.
@@ -21,9 +28,65 @@ def load_episodes() -> List[Episode]:
     Returns:
         List of episode dictionaries with metadata and processing status.
     """
-    config_path = Path(__file__).parent / "episodes.json"
-    with open(config_path, "r") as f:
+    with open(EPISODES_PATH, "r") as f:
         return json.load(f)
 
 
-__all__ = ["load_episodes", "Episode"]
+def save_episodes(episodes: List[Episode]) -> None:
+    """
+    Write episode configuration back to episodes.json.
+
+    The file is replaced atomically so an interrupted run never leaves a
+    truncated config behind.
+
+    Args:
+        episodes: Episode dictionaries to persist
+    """
+    tmp_path = EPISODES_PATH.with_suffix(".json.tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(episodes, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+    os.replace(tmp_path, EPISODES_PATH)
+
+
+@lru_cache(maxsize=1)
+def load_env() -> None:
+    """Load variables from .env into the environment once per process."""
+    load_dotenv()
+
+
+def get_positive_int_env(name: str, default: int) -> int:
+    """
+    Read a positive integer setting from the environment.
+
+    Args:
+        name: Environment variable to read
+        default: Value used when the variable is unset or empty
+
+    Returns:
+        The configured value
+
+    Raises:
+        ValueError: If the variable is not an integer of at least 1
+    """
+    raw_value = os.getenv(name)
+    if not raw_value:
+        return default
+
+    try:
+        value = int(raw_value)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer, got {raw_value!r}") from None
+
+    if value < 1:
+        raise ValueError(f"{name} must be at least 1, got {value}")
+    return value
+
+
+__all__ = [
+    "load_episodes",
+    "save_episodes",
+    "load_env",
+    "get_positive_int_env",
+    "Episode",
+]
@@ -1,15 +1,36 @@
-from .transcript_fomatter import TranscriptFormatter
-from .transcript_exporter import TranscriptExporter
-from .database_manager import DatabaseManager
-from .embedding_service import EmbeddingService
-from .audio_transcriber import AudioTranscriber
-from .pipeline_orchestrator import PipelineOrchestrator
+import importlib
+
+# Submodules are imported on first attribute access so that importing one
+# component doesn't pull in psycopg2, deepgram and openai all at once.
+_LAZY_IMPORTS = {
+    "TranscriptFormatter": ".transcript_fomatter",
+    "TranscriptExporter": ".transcript_exporter",
+    "DatabaseManager": ".database_manager",
+    "EmbeddingService": ".embedding_service",
+    "EmbeddingCache": ".embedding_cache",
+    "AudioTranscriber": ".audio_transcriber",
+    "PipelineOrchestrator": ".pipeline_orchestrator",
+}
 
 __all__ = [
     "TranscriptFormatter",
     "TranscriptExporter",
     "DatabaseManager",
     "EmbeddingService",
+    "EmbeddingCache",
     "PipelineOrchestrator",
     "AudioTranscriber",
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
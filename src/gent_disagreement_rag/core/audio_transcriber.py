@@ -1,21 +1,52 @@
+import logging
 import os
-import traceback
 from pathlib import Path
 from typing import Any, Optional
 
+import orjson
 from deepgram import DeepgramClient, PrerecordedOptions
-from dotenv import load_dotenv
+
+from gent_disagreement_rag.config import load_env
+
+# Read buffer size for the audio files uploaded to Deepgram
+AUDIO_CHUNK_SIZE = 1 << 20
+
+# Deepgram settings shared by every transcriber; built once at import
+DEEPGRAM_MODEL = "nova-3"
+DEEPGRAM_LANGUAGE = "en"
+TRANSCRIPTION_OPTIONS = PrerecordedOptions(
+    model=DEEPGRAM_MODEL,
+    language=DEEPGRAM_LANGUAGE,
+    smart_format=True,
+    punctuate=True,
+    paragraphs=True,
+    diarize=True,
+    filler_words=False,
+)
 
 
 class AudioTranscriber:
     """Handles transcript generation from audio files using Deepgram API."""
 
+    # Configuration - Deepgram settings (treat as read-only; shared by instances)
+    model: str = DEEPGRAM_MODEL
+    language: str = DEEPGRAM_LANGUAGE
+    transcription_options: PrerecordedOptions = TRANSCRIPTION_OPTIONS
+
     def __init__(self):
-        load_dotenv()
+        load_env()
+
+        self.logger = logging.getLogger(__name__)
 
         # Load and validate API key once during initialization
         self.api_key: str = self._load_and_validate_api_key()
 
+        # Create the Deepgram client once and reuse it for every transcription
+        try:
+            self.client: DeepgramClient = DeepgramClient(self.api_key)
+        except Exception as e:
+            raise RuntimeError(f"Failed to create Deepgram client: {e}") from e
+
         audio_dir = os.getenv("AUDIO_TRANSCRIBER_AUDIO_DIR")
         self.audio_dir: Path = Path(audio_dir).resolve()
 
@@ -25,19 +56,6 @@ class AudioTranscriber:
         # Ensure output directory exists
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
-        # Configuration - Deepgram settings
-        self.model: str = "nova-3"
-        self.language: str = "en"
-        self.transcription_options: PrerecordedOptions = PrerecordedOptions(
-            model=self.model,
-            language=self.language,
-            smart_format=True,
-            punctuate=True,
-            paragraphs=True,
-            diarize=True,
-            filler_words=False,
-        )
-
     def _load_and_validate_api_key(self) -> str:
         """Load and validate the Deepgram API key from environment variables.
 
@@ -73,42 +91,40 @@ class AudioTranscriber:
         if not file_path.exists():
             raise FileNotFoundError(f"Audio file not found: {file_path}")
 
-    def _create_deepgram_client(self) -> DeepgramClient:
-        """Create and return a Deepgram client.
-
-        Returns:
-            Configured DeepgramClient instance
-
-        Raises:
-            RuntimeError: If client creation fails
-        """
-        try:
-            client = DeepgramClient(self.api_key)
-            return client
-        except Exception as e:
-            raise RuntimeError(f"Failed to create Deepgram client: {e}") from e
-
-    def _transcribe_audio_file(
-        self, client: DeepgramClient, audio_file_path: Path
-    ) -> Any:
+    def _transcribe_audio_file(self, audio_file_path: Path) -> Any:
         """Transcribe the audio file using Deepgram API.
 
         Args:
-            client: DeepgramClient instance
             audio_file_path: Path to the audio file
 
         Returns:
             Deepgram API response object
         """
-
-        with open(audio_file_path, "rb") as audio_file:
-            response = client.listen.rest.v("1").transcribe_file(
-                {"buffer": audio_file},
+        # The SDK sends "buffer" and "stream" sources identically (the open
+        # file becomes the request body); "stream" is the key typed for file
+        # objects, while "buffer" is typed as bytes
+        with open(audio_file_path, "rb", buffering=AUDIO_CHUNK_SIZE) as audio_file:
+            response = self.client.listen.rest.v("1").transcribe_file(
+                {"stream": audio_file},
                 self.transcription_options,
             )
 
         return response
 
+    def _find_existing_transcript(self, base_file_name: str) -> Optional[Path]:
+        """Return the saved transcript for this audio file if one already exists.
+
+        Args:
+            base_file_name: Base name of the transcript file (without extension)
+
+        Returns:
+            Path to the existing non-empty transcript, or None
+        """
+        output_path = self.output_dir / f"{base_file_name}.json"
+        if output_path.exists() and output_path.stat().st_size > 0:
+            return output_path
+        return None
+
     def _save_transcript(self, response: Any, base_file_name: str) -> Path:
         """Save the transcript response to a JSON file.
 
@@ -120,9 +136,17 @@ class AudioTranscriber:
             Path to the saved transcript file
         """
         output_path: Path = self.output_dir / f"{base_file_name}.json"
+        tmp_path: Path = output_path.with_suffix(".json.tmp")
 
-        with open(output_path, "w") as f:
-            f.write(response.to_json(indent=4))
+        # Write to a temporary file and rename it into place, so a crash
+        # mid-write never leaves a truncated transcript at output_path
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(orjson.dumps(response.to_dict(), option=orjson.OPT_INDENT_2))
+            os.replace(tmp_path, output_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
 
         return output_path
 
@@ -137,16 +161,18 @@ class AudioTranscriber:
         """
         audio_file_path = self.audio_dir / file_name
 
+        # Skip the Deepgram call entirely when this file was already transcribed
+        existing_path = self._find_existing_transcript(audio_file_path.stem)
+        if existing_path:
+            return existing_path
+
         try:
 
             # Validate input file
             self._validate_audio_file(audio_file_path)
 
-            # Create Deepgram client
-            deepgram_client = self._create_deepgram_client()
-
             # Transcribe the audio file
-            response = self._transcribe_audio_file(deepgram_client, audio_file_path)
+            response = self._transcribe_audio_file(audio_file_path)
 
             # Save the transcript
             base_file_name = audio_file_path.stem
@@ -154,13 +180,17 @@ class AudioTranscriber:
 
             return output_path
 
-        except FileNotFoundError as e:
-            print(f"File not found: {e}")
-            return None
-        except ValueError as e:
-            print(f"Configuration error: {e}")
-            return None
         except Exception as e:
-            print(f"Transcription failed for {file_name}: {e}")
-            traceback.print_exc()
+            self._report_failure(file_name, e)
             return None
+
+    def _report_failure(self, file_name: str, error: Exception) -> None:
+        """Log a diagnostic for a failed transcription."""
+        if isinstance(error, FileNotFoundError):
+            self.logger.error("File not found: %s", error)
+        elif isinstance(error, ValueError):
+            self.logger.error("Configuration error: %s", error)
+        else:
+            self.logger.error(
+                "Transcription failed for %s: %s", file_name, error, exc_info=error
+            )
@@ -1,9 +1,95 @@
+import io
 import logging
 import os
-from typing import List, Optional
+import struct
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
 
+import numpy as np
 import psycopg2
-from dotenv import load_dotenv
+from pgvector.psycopg2 import register_vector
+from psycopg2.extras import execute_values
+from psycopg2.pool import ThreadedConnectionPool
+
+from gent_disagreement_rag.config import get_positive_int_env, load_env
+
+# Batches smaller than this use a multi-row INSERT; COPY setup isn't worth it
+COPY_MIN_ROWS = 64
+
+SEGMENT_COLUMNS = "speaker, text, embedding, episode_id, segment_index"
+
+# Re-storing an episode overwrites its segments instead of duplicating them
+SEGMENT_UPSERT_CONFLICT = """
+ON CONFLICT (episode_id, segment_index) DO UPDATE
+SET speaker = EXCLUDED.speaker, text = EXCLUDED.text, embedding = EXCLUDED.embedding
+"""
+
+# PostgreSQL binary COPY framing: signature, flags, header extension length
+_PGCOPY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack("!ii", 0, 0)
+_PGCOPY_TRAILER = struct.pack("!h", -1)
+_PGCOPY_NULL = struct.pack("!i", -1)
+
+
+def _copy_text(value: str) -> bytes:
+    data = value.encode("utf-8")
+    return struct.pack("!i", len(data)) + data
+
+
+def _copy_halfvec(values) -> bytes:
+    # pgvector's halfvec binary format: int16 dimensions, int16 unused, float2 values
+    data = np.asarray(values, dtype=">f2").tobytes()
+    return struct.pack("!ihh", 4 + len(data), len(data) // 2, 0) + data
+
+
+def _vector_literal(values: Optional[List[float]]) -> Optional[str]:
+    """Format a vector as pgvector's text input, e.g. '[0.1,0.2]'; None stays NULL."""
+    if values is None:
+        return None
+    return "[" + ",".join(map(str, values)) + "]"
+
+
+def _build_segment_copy_buffer(embeddings: List[dict], episode_id: int) -> io.BytesIO:
+    """Encode segment rows in PostgreSQL's binary COPY format."""
+    buffer = io.BytesIO()
+    buffer.write(_PGCOPY_HEADER)
+    for segment_index, embedding_data in enumerate(embeddings):
+        embedding = embedding_data["embedding"]
+        buffer.write(struct.pack("!h", 5))
+        buffer.write(_copy_text(embedding_data["speaker"]))
+        buffer.write(_copy_text(embedding_data["text"]))
+        buffer.write(_PGCOPY_NULL if embedding is None else _copy_halfvec(embedding))
+        buffer.write(
+            _PGCOPY_NULL if episode_id is None else struct.pack("!ii", 4, episode_id)
+        )
+        buffer.write(struct.pack("!ii", 4, segment_index))
+    buffer.write(_PGCOPY_TRAILER)
+    buffer.seek(0)
+    return buffer
+
+
+class VectorConnectionPool(ThreadedConnectionPool):
+    """
+    Connection pool that registers pgvector's type adapters on every new connection.
+
+    halfvec columns are then read as pgvector HalfVector objects (to_numpy()
+    gives a float16 array) and numpy arrays are sent as vector literals,
+    instead of round-tripping through Python lists and float[] casts.
+    """
+
+    def _connect(self, key=None):
+        conn = super()._connect(key)
+        try:
+            register_vector(conn)
+        except psycopg2.ProgrammingError:
+            # The vector extension isn't installed yet (e.g. before seed-db)
+            logging.getLogger(__name__).debug(
+                "pgvector type not found; vector adapters not registered"
+            )
+        # End the transaction opened by the type lookup
+        conn.rollback()
+        return conn
 
 
 class DatabaseManager:
@@ -24,7 +110,7 @@ class DatabaseManager:
         Loads from environment variables with sensible defaults.
         """
         # Load environment variables
-        load_dotenv()
+        load_env()
 
         self.connection_params = {
             "host": host or os.getenv("DB_HOST", "localhost"),
@@ -43,6 +129,11 @@ class DatabaseManager:
         # Setup logging
         self.logger = logging.getLogger(__name__)
 
+        # Connection pool is created lazily on first use
+        self.pool_max_connections = get_positive_int_env("DB_POOL_MAX", 8)
+        self._pool: Optional[VectorConnectionPool] = None
+        self._pool_lock = threading.Lock()
+
     def validate_connection(self) -> bool:
         """
         Validate that a database connection can be established.
@@ -55,7 +146,7 @@ class DatabaseManager:
         """
         try:
             conn = self.get_connection()
-            conn.close()
+            self.put_connection(conn)
             return True
         except Exception as e:
             raise ConnectionError(
@@ -64,39 +155,120 @@ class DatabaseManager:
                 f"Error: {e}"
             )
 
+    def _get_pool(self) -> VectorConnectionPool:
+        """
+        Return the connection pool, creating it on first use.
+        """
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = VectorConnectionPool(
+                        minconn=1,
+                        maxconn=self.pool_max_connections,
+                        **self.connection_params,
+                    )
+        return self._pool
+
     def get_connection(self):
         """
-        Create and return a database connection.
+        Check out a database connection from the pool.
+
+        Connections must be handed back with put_connection() when done.
+        """
+        return self._get_pool().getconn()
+
+    def put_connection(self, conn) -> None:
+        """
+        Return a connection previously obtained from get_connection() to the pool.
+        """
+        self._get_pool().putconn(conn)
+
+    @contextmanager
+    def connection(self) -> Iterator:
+        """
+        Check out a pooled connection for the duration of a with block.
+        """
+        conn = self.get_connection()
+        try:
+            yield conn
+        finally:
+            self.put_connection(conn)
+
+    def close(self) -> None:
+        """
+        Close every pooled connection.
         """
-        return psycopg2.connect(**self.connection_params)
+        if self._pool is not None:
+            self._pool.closeall()
+            self._pool = None
 
-    def store_embeddings(self, embeddings: List[dict], episode_id: int) -> None:
+    def store_embeddings(
+        self, embeddings: List[dict], episode_id: int, batch_size: int = 500
+    ) -> None:
         """
         Store a list of embeddings with their associated segment data into the database.
 
+        Each segment is keyed by (episode_id, position in ``embeddings``), so
+        storing an episode again updates its rows in place rather than adding
+        duplicates, and rows left over from a previous run that produced more
+        segments are deleted in the same transaction. Batches of COPY_MIN_ROWS or more are streamed with binary
+        COPY into a staging table and merged; smaller batches are sent as
+        multi-row INSERT statements.
+
         Args:
-            embeddings: List of dictionaries containing 'speaker', 'text', and 'embedding' keys
+            embeddings: List of dictionaries containing 'speaker', 'text', and 'embedding'
+                keys; embeddings may be lists of floats or numpy arrays
             episode_id: The episode ID to associate with these embeddings
+            batch_size: Number of rows sent per multi-row INSERT statement
         """
-        conn = self.get_connection()
-        cursor = conn.cursor()
-
-        try:
-            for embedding_data in embeddings:
+        start = time.perf_counter()
+        with self.connection() as conn, conn.cursor() as cursor:
+            try:
                 cursor.execute(
-                    "INSERT INTO transcript_segments (speaker, text, embedding, episode_id) VALUES (%s, %s, %s, %s)",
-                    (
-                        embedding_data["speaker"],
-                        embedding_data["text"],
-                        embedding_data["embedding"],
-                        episode_id,
-                    ),
+                    "DELETE FROM transcript_segments "
+                    "WHERE episode_id = %s AND segment_index >= %s",
+                    (episode_id, len(embeddings)),
                 )
-            conn.commit()
-        except Exception as e:
-            self.logger.error(f"Error storing embeddings: {e}")
-            conn.rollback()
-            raise
-        finally:
-            cursor.close()
-            conn.close()
+                if len(embeddings) >= COPY_MIN_ROWS:
+                    # COPY can't resolve conflicts, so stage the rows first
+                    cursor.execute(
+                        f"""
+                        CREATE TEMP TABLE transcript_segments_stage ON COMMIT DROP AS
+                        SELECT {SEGMENT_COLUMNS} FROM transcript_segments WITH NO DATA
+                        """
+                    )
+                    cursor.copy_expert(
+                        f"COPY transcript_segments_stage ({SEGMENT_COLUMNS}) FROM STDIN WITH (FORMAT binary)",
+                        _build_segment_copy_buffer(embeddings, episode_id),
+                    )
+                    cursor.execute(
+                        f"INSERT INTO transcript_segments ({SEGMENT_COLUMNS}) "
+                        f"SELECT {SEGMENT_COLUMNS} FROM transcript_segments_stage"
+                        + SEGMENT_UPSERT_CONFLICT
+                    )
+                else:
+                    execute_values(
+                        cursor,
+                        f"INSERT INTO transcript_segments ({SEGMENT_COLUMNS}) VALUES %s"
+                        + SEGMENT_UPSERT_CONFLICT,
+                        [
+                            (
+                                embedding_data["speaker"],
+                                embedding_data["text"],
+                                _vector_literal(embedding_data["embedding"]),
+                                episode_id,
+                                segment_index,
+                            )
+                            for segment_index, embedding_data in enumerate(embeddings)
+                        ],
+                        page_size=batch_size,
+                    )
+                conn.commit()
+            except Exception as e:
+                self.logger.error(f"Error storing embeddings: {e}")
+                conn.rollback()
+                raise
+
+        self.logger.debug(
+            "Stored %d segments in %.2fs", len(embeddings), time.perf_counter() - start
+        )
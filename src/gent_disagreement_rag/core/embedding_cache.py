@@ -0,0 +1,79 @@
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import numpy as np
+
+
+class EmbeddingCache:
+    """Persistent SQLite cache of embeddings keyed by SHA-256(model, text)."""
+
+    def __init__(self, cache_path: Path, model: str):
+        self.cache_path = Path(cache_path)
+        self.model = model
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # One shared connection; the lock serializes access across threads
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.cache_path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, vec BLOB NOT NULL)"
+            )
+
+    def _key(self, text: str) -> str:
+        return hashlib.sha256(f"{self.model}\x00{text}".encode("utf-8")).hexdigest()
+
+    def get_or_compute(
+        self,
+        texts: List[str],
+        compute_fn: Callable[[List[str]], List[np.ndarray]],
+    ) -> List[np.ndarray]:
+        """
+        Return embeddings for texts, calling compute_fn only for uncached ones.
+
+        Args:
+            texts: Texts to embed
+            compute_fn: Embeds a list of texts, returning vectors in the same order
+
+        Returns:
+            One float32 embedding per input text, in input order
+        """
+        keys = [self._key(text) for text in texts]
+        found: Dict[str, np.ndarray] = {}
+
+        with self._lock:
+            unique_keys = list(dict.fromkeys(keys))
+            # Stay under SQLite's bound-parameter limit
+            for start in range(0, len(unique_keys), 500):
+                chunk = unique_keys[start : start + 500]
+                rows = self._conn.execute(
+                    f"SELECT key, vec FROM cache WHERE key IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                )
+                for key, vec in rows:
+                    found[key] = np.frombuffer(vec, dtype=np.float32)
+
+        # Each distinct uncached text is sent to the provider once
+        uncached = {key: text for key, text in zip(keys, texts) if key not in found}
+        if uncached:
+            computed = compute_fn(list(uncached.values()))
+            new_entries = dict(zip(uncached, computed))
+            with self._lock, self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO cache (key, vec) VALUES (?, ?)",
+                    [
+                        (key, np.asarray(vec, dtype=np.float32).tobytes())
+                        for key, vec in new_entries.items()
+                    ],
+                )
+            found.update(new_entries)
+
+        return [found[key] for key in keys]
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        with self._lock:
+            self._conn.close()
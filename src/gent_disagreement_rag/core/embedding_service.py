@@ -1,40 +1,253 @@
+import base64
+import logging
 import os
-from typing import List, Dict, Any
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterator, List, Dict, Any, Optional, Tuple
+
+import numpy as np
+import orjson
 from openai import OpenAI
-from dotenv import load_dotenv
+
+from gent_disagreement_rag.config import load_env
+from gent_disagreement_rag.core.embedding_cache import EmbeddingCache
+
+EMBEDDING_MODEL = "text-embedding-3-small"
+
+# Texts per embeddings API request (the API accepts at most 2048 inputs)
+EMBEDDING_BATCH_SIZE = 128
+
+# Estimated tokens per embeddings API request, kept below the API's 300k cap
+EMBEDDING_MAX_REQUEST_TOKENS = 250_000
+
+# Embeddings API requests in flight at once for a single call to embed_batch
+EMBEDDING_CONCURRENCY = 4
+
+# Attempts the OpenAI client makes per request on 429/5xx/connection errors,
+# with exponential backoff and jitter (honouring Retry-After)
+EMBEDDING_MAX_RETRIES = 6
+
+# Number of distinct texts whose single-text embeddings are kept in memory
+EMBEDDING_CACHE_SIZE = 4096
+
+# Seconds between status checks while waiting on a Batch API job
+BATCH_POLL_INTERVAL = 30
+
+
+def _estimate_tokens(text: str) -> int:
+    """Cheap upper-bound token count (English averages ~4 characters per token)."""
+    return len(text) // 3 + 1
+
+
+def _batch_bounds(
+    texts: List[str], batch_size: int, max_tokens: int = EMBEDDING_MAX_REQUEST_TOKENS
+) -> Iterator[Tuple[int, int]]:
+    """Yield (start, end) slices of texts that fit both the count and token limits."""
+    start = 0
+    tokens = 0
+    for index, text in enumerate(texts):
+        text_tokens = _estimate_tokens(text)
+        if index > start and (
+            index - start >= batch_size or tokens + text_tokens > max_tokens
+        ):
+            yield start, index
+            start, tokens = index, 0
+        tokens += text_tokens
+    if start < len(texts):
+        yield start, len(texts)
+
+
+@lru_cache(maxsize=None)
+def _get_openai_client(api_key: Optional[str]) -> OpenAI:
+    """Return the process-wide OpenAI client for this key.
+
+    Sharing one client lets every service instance and worker thread reuse
+    the same keep-alive connection pool to the API.
+    """
+    return OpenAI(api_key=api_key, max_retries=EMBEDDING_MAX_RETRIES)
 
 
 class EmbeddingService:
     """Handles embedding generation for transcript segments."""
 
     def __init__(self):
-        load_dotenv()
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        load_env()
+        self.logger = logging.getLogger(__name__)
+        self.client = _get_openai_client(os.getenv("OPENAI_API_KEY"))
+
+        # Optional persistent cache so unchanged segments are never re-embedded
+        cache_path = os.getenv("EMBEDDING_CACHE_PATH")
+        self.cache: Optional[EmbeddingCache] = (
+            EmbeddingCache(Path(cache_path), EMBEDDING_MODEL) if cache_path else None
+        )
+
+        # Per-instance memo of single-text embeddings (e.g. repeated queries)
+        self._cached_embedding = lru_cache(maxsize=EMBEDDING_CACHE_SIZE)(
+            self._request_embedding
+        )
 
     def generate_embedding(self, text: str) -> List[float]:
-        """Generate a single embedding for the given text."""
+        """Generate a single embedding for the given text.
+
+        Texts that differ only in whitespace share one cached API result.
+        """
+        return list(self._cached_embedding(" ".join(text.split())))
+
+    def _request_embedding(self, text: str) -> Tuple[float, ...]:
         response = self.client.embeddings.create(
-            model="text-embedding-3-small", input=text
+            model=EMBEDDING_MODEL, input=text
         )
-        return response.data[0].embedding
+        return tuple(response.data[0].embedding)
 
-    def generate_embeddings_batched(self, text_array: List[str]) -> List[List[float]]:
-        """Generate embeddings for multiple texts in one API call."""
+    def generate_embeddings_batched(self, text_array: List[str]) -> List[np.ndarray]:
+        """Generate embeddings for multiple texts in one API call.
+
+        Vectors are requested base64-encoded and decoded straight into float32
+        arrays, skipping the per-element Python floats of the JSON form.
+        """
         response = self.client.embeddings.create(
-            model="text-embedding-3-small", input=text_array
+            model=EMBEDDING_MODEL, input=text_array, encoding_format="base64"
+        )
+        return [
+            np.frombuffer(base64.b64decode(item.embedding), dtype=np.float32)
+            for item in response.data
+        ]
+
+    def embed_batch(
+        self, texts: List[str], batch_size: int = EMBEDDING_BATCH_SIZE
+    ) -> List[np.ndarray]:
+        """Generate embeddings for any number of texts.
+
+        Each API call carries at most batch_size texts and stays under the
+        per-request token cap. Texts are batched shortest-first, so the few
+        long segments share requests instead of cutting short batches of
+        otherwise small ones. Up to EMBEDDING_CONCURRENCY requests run at once;
+        results are returned in input order.
+        """
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        sorted_texts = [texts[i] for i in order]
+        batches = [
+            sorted_texts[start:end]
+            for start, end in _batch_bounds(sorted_texts, batch_size)
+        ]
+
+        sorted_embeddings: List[np.ndarray] = []
+        if len(batches) == 1:
+            sorted_embeddings = self.generate_embeddings_batched(batches[0])
+        elif batches:
+            with ThreadPoolExecutor(
+                max_workers=min(EMBEDDING_CONCURRENCY, len(batches))
+            ) as executor:
+                for batch_embeddings in executor.map(
+                    self.generate_embeddings_batched, batches
+                ):
+                    sorted_embeddings.extend(batch_embeddings)
+
+        # Undo the length sort
+        embeddings: List[np.ndarray] = [None] * len(texts)
+        for position, embedding in zip(order, sorted_embeddings):
+            embeddings[position] = embedding
+        return embeddings
+
+    def embed_batch_offline(
+        self,
+        texts: List[str],
+        batch_size: int = EMBEDDING_BATCH_SIZE,
+        poll_interval: float = BATCH_POLL_INTERVAL,
+    ) -> List[np.ndarray]:
+        """Generate embeddings through the OpenAI Batch API.
+
+        Batch jobs cost half as much as synchronous requests but may take up to
+        24 hours, so this is meant for bulk re-ingests, not interactive runs.
+        Blocks until the job finishes.
+
+        Raises:
+            RuntimeError: If the job does not complete or any request in it fails
+        """
+        if not texts:
+            return []
+
+        # One JSONL line per request; custom_id is the offset of its first text
+        requests = b"".join(
+            orjson.dumps(
+                {
+                    "custom_id": str(start),
+                    "method": "POST",
+                    "url": "/v1/embeddings",
+                    "body": {
+                        "model": EMBEDDING_MODEL,
+                        "input": texts[start:end],
+                        "encoding_format": "base64",
+                    },
+                }
+            )
+            + b"\n"
+            for start, end in _batch_bounds(texts, batch_size)
+        )
+        input_file = self.client.files.create(
+            file=("embeddings.jsonl", requests), purpose="batch"
         )
-        return [item.embedding for item in response.data]
+        batch = self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/embeddings",
+            completion_window="24h",
+        )
+        self.logger.info(f"Submitted embeddings batch {batch.id}")
+
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            time.sleep(poll_interval)
+            batch = self.client.batches.retrieve(batch.id)
+
+        if batch.status != "completed" or not batch.output_file_id:
+            raise RuntimeError(f"Embeddings batch {batch.id} ended as {batch.status}")
+
+        embeddings: List[np.ndarray] = [None] * len(texts)
+        output = self.client.files.content(batch.output_file_id).content
+        for line in output.splitlines():
+            result = orjson.loads(line)
+            response = result.get("response") or {}
+            if result.get("error") or response.get("status_code") != 200:
+                raise RuntimeError(
+                    f"Embeddings batch request {result['custom_id']} failed: "
+                    f"{result.get('error') or response.get('body')}"
+                )
+            start = int(result["custom_id"])
+            for item in response["body"]["data"]:
+                embeddings[start + item["index"]] = np.frombuffer(
+                    base64.b64decode(item["embedding"]), dtype=np.float32
+                )
+
+        if any(embedding is None for embedding in embeddings):
+            raise RuntimeError(f"Embeddings batch {batch.id} is missing results")
+        return embeddings
 
     def generate_embeddings(
-        self, segments: List[Dict[str, Any]]
+        self, segments: List[Dict[str, Any]], offline: bool = False
     ) -> List[Dict[str, Any]]:
-        """Generate embeddings for all segments using batch API call (efficient)."""
+        """Generate embeddings for all segments using batched API calls (efficient).
+
+        With offline=True the embeddings come from a Batch API job instead of
+        synchronous requests (see embed_batch_offline).
+        """
         try:
             # Extract all text from segments
             segment_texts = [segment["text"] for segment in segments]
+            embed = self.embed_batch_offline if offline else self.embed_batch
+
+            # Embed each distinct text once; repeated short segments ("Yeah.",
+            # "Right.") share a single vector
+            unique_texts = list(dict.fromkeys(segment_texts))
+
+            # Generate all embeddings in as few API calls as possible
+            if self.cache:
+                unique_embeddings = self.cache.get_or_compute(unique_texts, embed)
+            else:
+                unique_embeddings = embed(unique_texts)
 
-            # Generate all embeddings in one API call
-            embeddings_batch = self.generate_embeddings_batched(segment_texts)
+            embedding_by_text = dict(zip(unique_texts, unique_embeddings))
+            embeddings_batch = [embedding_by_text[text] for text in segment_texts]
 
             # Map embeddings back to segments
             segments_with_embeddings = []
@@ -49,7 +262,7 @@ class EmbeddingService:
 
             return segments_with_embeddings
         except Exception as e:
-            print("Error generating embeddings:", e)
+            self.logger.error(f"Error generating embeddings: {e}")
             raise
 
     def generate_embeddings_sequential(
@@ -70,5 +283,5 @@ class EmbeddingService:
 
             return embeddings
         except Exception as e:
-            print("Error generating embeddings:", e)
+            self.logger.error(f"Error generating embeddings: {e}")
             raise
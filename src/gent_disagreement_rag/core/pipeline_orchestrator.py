@@ -1,6 +1,12 @@
 import logging
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from gent_disagreement_rag.config import load_episodes
+from typing import Optional
+from gent_disagreement_rag.config import (
+    get_positive_int_env,
+    load_episodes,
+    save_episodes,
+)
 from gent_disagreement_rag.core import (
     AudioTranscriber,
     DatabaseManager,
@@ -10,17 +16,73 @@ from gent_disagreement_rag.core import (
 )
 from gent_disagreement_rag.utils import load_processed_segments
 
+# Deepgram requests in flight at once when transcribing pending episodes
+TRANSCRIPTION_CONCURRENCY = 5
+
+# Default number of transcribed episodes formatted, embedded and stored at
+# once; override with PIPELINE_WORKERS
+PROCESSING_CONCURRENCY = 2
+
+
+def _format_raw_transcript(
+    raw_transcript_path: Path,
+    speakers_map: dict,
+    output_dir: Path,
+    cache_dir: Optional[Path],
+) -> Path:
+    """Format and export one raw transcript; runs in a worker process."""
+    return _export_formatted_segments(
+        TranscriptFormatter(cache_dir=cache_dir),
+        TranscriptExporter(output_dir=output_dir),
+        raw_transcript_path,
+        speakers_map,
+    )
+
+
+def _export_formatted_segments(
+    formatter: TranscriptFormatter,
+    exporter: TranscriptExporter,
+    raw_transcript_path: Path,
+    speakers_map: dict,
+) -> Path:
+    """Format a raw transcript and export the segments.
+
+    Without a segment cache there is nothing to store, so segments are
+    streamed from the formatter straight into the exported file.
+    """
+    if formatter.cache_dir:
+        segments = formatter.format_segments(raw_transcript_path, speakers_map)
+    else:
+        segments = formatter.iter_segments(raw_transcript_path, speakers_map)
+
+    return exporter.export_segments(segments, raw_transcript_path.stem)
+
 
 class PipelineOrchestrator:
-    def __init__(self):
+    def __init__(self, offline_embeddings: bool = False):
         self.logger = logging.getLogger(__name__)
+        # Embed through the Batch API instead of synchronous requests
+        self.offline_embeddings = offline_embeddings
         self.database_manager = DatabaseManager()
+        self.processing_workers = get_positive_int_env(
+            "PIPELINE_WORKERS", PROCESSING_CONCURRENCY
+        )
+
+        # Each processing worker holds one pooled connection while storing, and
+        # the pool raises instead of waiting when every connection is taken
+        pool_max = self.database_manager.pool_max_connections
+        if self.processing_workers > pool_max:
+            self.logger.warning(
+                f"PIPELINE_WORKERS={self.processing_workers} exceeds "
+                f"DB_POOL_MAX={pool_max}; using {pool_max} workers"
+            )
+            self.processing_workers = pool_max
 
         # Verify database connection
         try:
             self.database_manager.validate_connection()
         except ConnectionError as e:
-            print(f"❌ {e}")
+            self.logger.error(f"❌ {e}")
             raise
 
         self.audio_transcriber = AudioTranscriber()
@@ -30,32 +92,111 @@ class PipelineOrchestrator:
         self.episodes = load_episodes()
 
     def process_episodes(self):
-        """Process all unprocessed episodes through the full pipeline."""
-        unprocessed = [ep for ep in self.episodes if not ep.get("processed", False)]
-        total = len(unprocessed)
+        """
+        Process all unprocessed episodes through the full pipeline.
+
+        Transcription (Deepgram) and embedding (OpenAI) talk to different
+        services, so the two stages run in separate thread pools: each episode
+        moves on to formatting, embedding and storage as soon as its own
+        transcript is ready, while later episodes are still transcribing.
+
+        A failed episode doesn't stop the others. Every episode that completes
+        is marked processed, and the first failure is raised once all of
+        them have finished.
+        """
+        pending = [ep for ep in self.episodes if not self._should_skip_episode(ep)]
+        total = len(pending)
         self.logger.info(f"Starting pipeline processing for {total} episode(s)")
 
-        for idx, episode in enumerate(self.episodes, 1):
-            if self._should_skip_episode(episode):
-                continue
-            episode_info = self._get_episode_info(episode)
-            self.logger.info(f"Processing {idx}/{total}: {episode_info}")
-            self._process_single_episode(episode)
+        first_error: Optional[Exception] = None
+        completed = 0
+
+        with ThreadPoolExecutor(
+            max_workers=TRANSCRIPTION_CONCURRENCY, thread_name_prefix="transcribe"
+        ) as transcription_pool, ThreadPoolExecutor(
+            max_workers=self.processing_workers, thread_name_prefix="process"
+        ) as processing_pool:
+            transcription_futures = {
+                transcription_pool.submit(
+                    self.audio_transcriber.generate_transcript, episode["file_name"]
+                ): episode
+                for episode in pending
+            }
+
+            processing_futures = {}
+            for future in as_completed(transcription_futures):
+                episode = transcription_futures[future]
+                try:
+                    raw_transcript_path = future.result()
+                    if raw_transcript_path is None:
+                        raise RuntimeError(
+                            f"Transcription failed for {episode['file_name']}"
+                        )
+                except Exception as e:
+                    self.logger.error(f"✗ {self._get_episode_info(episode)}: {e}")
+                    first_error = first_error or e
+                    continue
+
+                self.logger.info(f"✓ Transcribed {self._get_episode_info(episode)}")
+                processing_futures[
+                    processing_pool.submit(
+                        self._process_single_episode, episode, raw_transcript_path
+                    )
+                ] = episode
+
+            for future in as_completed(processing_futures):
+                episode = processing_futures[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    self.logger.error(
+                        f"✗ {self._get_episode_info(episode)}: {e}", exc_info=e
+                    )
+                    first_error = first_error or e
+                    continue
+
+                completed += 1
+                self.logger.info(
+                    f"✓ Completed {completed}/{total}: {self._get_episode_info(episode)}"
+                )
+
+                # Record progress after each episode so a later failure or rerun
+                # doesn't repeat work that has already been stored
+                episode["processed"] = True
+                save_episodes(self.episodes)
+
+        if first_error is not None:
+            raise first_error
 
         self.logger.info(f"Pipeline processing complete. Processed {total} episode(s)")
 
-    def format_existing_raw_transcripts(self):
-        """Format existing raw transcripts without transcription."""
-        unprocessed = [ep for ep in self.episodes if not ep.get("processed", False)]
-        total = len(unprocessed)
+    def format_existing_raw_transcripts(self, max_workers: Optional[int] = None):
+        """
+        Format existing raw transcripts without transcription.
+
+        Episodes are independent and formatting is CPU-bound, so they are
+        formatted in parallel worker processes (one per CPU by default).
+        """
+        pending = [ep for ep in self.episodes if not self._should_skip_episode(ep)]
+        total = len(pending)
         self.logger.info(f"Starting formatting for {total} episode(s)")
 
-        for idx, episode in enumerate(self.episodes, 1):
-            if self._should_skip_episode(episode):
-                continue
-            episode_info = self._get_episode_info(episode)
-            self.logger.info(f"Formatting {idx}/{total}: {episode_info}")
-            self._format_single_episode(episode)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    _format_raw_transcript,
+                    Path(episode["raw_transcript_path"]),
+                    episode["speakers_map"],
+                    self.transcript_exporter.output_dir,
+                    self.transcript_formatter.cache_dir,
+                ): episode
+                for episode in pending
+            }
+
+            for idx, future in enumerate(as_completed(futures), 1):
+                episode_info = self._get_episode_info(futures[future])
+                future.result()
+                self.logger.info(f"✓ Formatted {idx}/{total}: {episode_info}")
 
         self.logger.info(f"Formatting complete. Formatted {total} episode(s)")
 
@@ -81,31 +222,27 @@ class PipelineOrchestrator:
             return True
         return False
 
-    def _process_single_episode(self, episode: dict) -> None:
+    def _process_single_episode(self, episode: dict, raw_transcript_path: Path) -> None:
         """
-        Process a single episode through the full pipeline.
+        Process a single transcribed episode through the rest of the pipeline.
 
         Pipeline stages:
-        1. Transcribe audio file
-        2. Format transcript segments
-        3. Export formatted segments
-        4. Generate embeddings
-        5. Store embeddings in database
+        1. Format transcript segments
+        2. Export formatted segments
+        3. Generate embeddings
+        4. Store embeddings in database
 
         Args:
             episode: Episode dictionary with metadata
+            raw_transcript_path: Transcript produced for the episode
 
         Raises:
             Exception: If any pipeline stage fails
         """
         speakers_map = episode["speakers_map"]
-        file_name = episode["file_name"]
         episode_id = episode["episode_id"]
 
-        # Transcribe audio file
-        self.logger.info(f"  → Transcribing audio")
-        raw_transcript_path = self.audio_transcriber.generate_transcript(file_name)
-        self.logger.info(f"  ✓ Transcription complete")
+        self.logger.info(f"Processing {self._get_episode_info(episode)}")
 
         # Format and export the raw transcript
         self.logger.info(f"  → Formatting transcript")
@@ -117,45 +254,22 @@ class PipelineOrchestrator:
         # Generate embeddings
         self.logger.info(f"  → Generating embeddings")
         segments = load_processed_segments(Path(processed_transcript_path))
-        embeddings = self.embedding_service.generate_embeddings(segments)
+        embeddings = self.embedding_service.generate_embeddings(
+            segments, offline=self.offline_embeddings
+        )
         self.logger.info(f"  ✓ Generated {len(embeddings)} embeddings")
 
         # Store the embeddings in the database
         self.logger.info(f"  → Storing embeddings")
         self.database_manager.store_embeddings(embeddings, episode_id)
         self.logger.info(f"  ✓ Stored {len(embeddings)} embeddings")
-        self.logger.info(f"✓ Completed processing")
-
-    def _format_single_episode(self, episode: dict) -> None:
-        """
-        Format an existing raw transcript for a single episode.
-
-        Pipeline stages:
-        1. Format transcript segments
-        2. Export formatted segments
-
-        Args:
-            episode: Episode dictionary with metadata including raw_transcript_path
-
-        Raises:
-            Exception: If formatting/export fails
-        """
-        speakers_map = episode["speakers_map"]
-        raw_transcript_path = Path(episode["raw_transcript_path"])
-
-        # Format and export the raw transcript
-        self.logger.info(f"  → Formatting raw transcript")
-        self._format_and_export_raw_transcript(raw_transcript_path, speakers_map)
-        self.logger.info(f"  ✓ Formatting complete")
-        self.logger.info(f"✓ Completed formatting")
 
     def _format_and_export_raw_transcript(
         self, raw_transcript_path: Path, speakers_map: dict
     ) -> Path:
-        formatted_segments = self.transcript_formatter.format_segments(
-            raw_transcript_path, speakers_map
-        )
-
-        return self.transcript_exporter.export_segments(
-            formatted_segments, raw_transcript_path.stem
+        return _export_formatted_segments(
+            self.transcript_formatter,
+            self.transcript_exporter,
+            raw_transcript_path,
+            speakers_map,
         )
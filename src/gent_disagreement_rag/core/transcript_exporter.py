@@ -1,15 +1,17 @@
-import json
 import os
 from pathlib import Path
-from typing import List, Dict
-from dotenv import load_dotenv
+from typing import Dict, Iterable
+
+import orjson
+
+from gent_disagreement_rag.config import load_env
 
 
 class TranscriptExporter:
     """Handles exporting formatted transcript segments to various output formats."""
 
     def __init__(self, output_dir: Path = None):
-        load_dotenv()
+        load_env()
         self.output_dir = output_dir or self._get_default_output_dir()
         self._ensure_output_directory()
 
@@ -26,11 +28,35 @@ class TranscriptExporter:
         """Ensure output directory exists."""
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
-    def export_segments(self, segments: List[Dict[str, str]], filename: str) -> Path:
-        """Export formatted segments to JSON file."""
-        output_file = self.output_dir / f"{filename}.json"
+    def export_segments(
+        self, segments: Iterable[Dict[str, str]], filename: str
+    ) -> Path:
+        """Export formatted segments to JSON file.
 
-        with open(output_file, "w") as f:
-            json.dump(segments, f, indent=2)
+        Segments are serialized and written one at a time, so a generator is
+        never materialized into a list. They go to a temporary file that is
+        renamed into place only once every segment has been written, so a
+        failure part-way through never replaces an earlier export.
+        """
+        output_file = self.output_dir / f"{filename}.json"
+        tmp_file = output_file.with_suffix(".json.tmp")
+
+        try:
+            with open(tmp_file, "wb") as f:
+                separator = b"\n  "
+                f.write(b"[")
+                for segment in segments:
+                    f.write(separator)
+                    f.write(
+                        orjson.dumps(segment, option=orjson.OPT_INDENT_2).replace(
+                            b"\n", b"\n  "
+                        )
+                    )
+                    separator = b",\n  "
+                f.write(b"]" if separator == b"\n  " else b"\n]")
+            os.replace(tmp_file, output_file)
+        except BaseException:
+            tmp_file.unlink(missing_ok=True)
+            raise
 
         return output_file
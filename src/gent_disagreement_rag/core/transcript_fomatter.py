@@ -1,54 +1,148 @@
-import json
+import hashlib
+import os
 from pathlib import Path
-from typing import List, Dict
+from typing import Dict, Iterator, List, Optional, Union
+
+import msgspec
+import orjson
+
+from gent_disagreement_rag.config import load_env
+
+
+# Only the parts of the Deepgram response the formatter reads. Decoding into
+# these skips words, timings and metadata instead of building dicts for them.
+class _Sentence(msgspec.Struct):
+    text: str
+
+
+class _Paragraph(msgspec.Struct):
+    speaker: Union[int, str]
+    sentences: List[_Sentence]
+
+
+class _Paragraphs(msgspec.Struct):
+    paragraphs: List[_Paragraph]
+
+
+class _Alternative(msgspec.Struct):
+    paragraphs: _Paragraphs
+
+
+class _Channel(msgspec.Struct):
+    alternatives: List[_Alternative]
+
+
+class _Results(msgspec.Struct):
+    channels: List[_Channel]
+
+
+class _Transcript(msgspec.Struct):
+    results: _Results
+
+
+_transcript_decoder = msgspec.json.Decoder(_Transcript)
+
+# Part of the segment cache key; bump whenever the formatted output changes
+# so segments cached by an older version are not served again
+SEGMENT_FORMAT_VERSION = 2
 
 
 class TranscriptFormatter:
     """Formats raw transcript data into structured segments for further processing."""
 
+    def __init__(self, cache_dir: Optional[Path] = None):
+        load_env()
+
+        # Optional on-disk cache of formatted segments, keyed by content hash
+        cache_dir = cache_dir or os.getenv("TRANSCRIPT_FORMATTER_CACHE_DIR")
+        self.cache_dir: Optional[Path] = Path(cache_dir).resolve() if cache_dir else None
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _cache_path(self, raw_bytes: bytes, speakers_map: Dict[str, str]) -> Path:
+        """Return the cache file for this transcript, speaker map and format version."""
+        digest = hashlib.blake2b(raw_bytes, digest_size=16)
+        digest.update(SEGMENT_FORMAT_VERSION.to_bytes(4, "big"))
+        digest.update(orjson.dumps(speakers_map, option=orjson.OPT_SORT_KEYS))
+        return self.cache_dir / f"{digest.hexdigest()}.json"
+
     def format_segments(
         self, transcript_path: Path, speakers_map: Dict[str, str]
     ) -> List[Dict[str, str]]:
         """Format raw transcript data into structured segments."""
 
-        segments = []
-        current_speaker = None
+        with open(transcript_path, "rb") as f:
+            raw_bytes = f.read()
 
-        with open(transcript_path, "r") as f:
-            raw_transcript_data = json.load(f)
+        cache_path = self._cache_path(raw_bytes, speakers_map) if self.cache_dir else None
+        if cache_path and cache_path.exists():
+            return orjson.loads(cache_path.read_bytes())
 
-            paragraphs = raw_transcript_data["results"]["channels"][0]["alternatives"][
-                0
-            ]["paragraphs"]["paragraphs"]
+        segments = list(
+            self._iter_segments(_transcript_decoder.decode(raw_bytes), speakers_map)
+        )
 
-            current_text = []
+        if cache_path:
+            tmp_path = cache_path.with_suffix(".json.tmp")
+            tmp_path.write_bytes(orjson.dumps(segments))
+            os.replace(tmp_path, cache_path)
 
-            for paragraph in paragraphs:
-                speaker = str(paragraph["speaker"])
-                speaker = speakers_map.get(speaker, f"Speaker {speaker}")
+        return segments
+
+    def iter_segments(
+        self, transcript_path: Path, speakers_map: Dict[str, str]
+    ) -> Iterator[Dict[str, str]]:
+        """Yield formatted segments one at a time, without using the segment cache."""
 
-                # If speaker changes, save current segment and start new one
-                if current_speaker != speaker:
-                    if current_text:
-                        segments.append(
-                            {
-                                "speaker": current_speaker,
-                                "text": " ".join(current_text).strip(),
-                            }
-                        )
+        with open(transcript_path, "rb") as f:
+            transcript = _transcript_decoder.decode(f.read())
 
-                    current_speaker = speaker
-                    current_text = []
+        yield from self._iter_segments(transcript, speakers_map)
 
-                # Add sentences from this paragraph to current text
-                current_text.extend(
-                    sentence["text"] for sentence in paragraph["sentences"]
-                )
+    def _iter_segments(
+        self, transcript: _Transcript, speakers_map: Dict[str, str]
+    ) -> Iterator[Dict[str, str]]:
+        """Group Deepgram paragraphs into consecutive same-speaker segments.
 
-            # Don't forget the last segment
-            if current_text:
-                segments.append(
-                    {"speaker": current_speaker, "text": " ".join(current_text).strip()}
-                )
+        Segments whose text is empty after joining are dropped, so they are
+        never exported, embedded or stored.
+        """
 
-        return segments
+        current_speaker = None
+
+        alternative = transcript.results.channels[0].alternatives[0]
+        paragraphs = alternative.paragraphs.paragraphs
+
+        # Reuse one buffer for every segment; bind append once for the loop
+        current_text: List[str] = []
+        append = current_text.append
+
+        # Deepgram speaker ids (int or str) -> display names, resolved once per id
+        speaker_names: Dict[Union[int, str], str] = {}
+
+        for paragraph in paragraphs:
+            speaker_id = paragraph.speaker
+            speaker = speaker_names.get(speaker_id)
+            if speaker is None:
+                speaker = speakers_map.get(str(speaker_id), f"Speaker {speaker_id}")
+                speaker_names[speaker_id] = speaker
+
+            # If speaker changes, save current segment and start new one
+            if current_speaker != speaker:
+                if current_text:
+                    text = " ".join(current_text).strip()
+                    if text:
+                        yield {"speaker": current_speaker, "text": text}
+                    current_text.clear()
+
+                current_speaker = speaker
+
+            # Add sentences from this paragraph to current text
+            for sentence in paragraph.sentences:
+                append(sentence.text)
+
+        # Don't forget the last segment
+        if current_text:
+            text = " ".join(current_text).strip()
+            if text:
+                yield {"speaker": current_speaker, "text": text}
@@ -8,6 +8,7 @@ To reset the database (WARNING: deletes all data):
     poetry run reset-db
 """
 
+import argparse
 import logging
 
 from gent_disagreement_rag.core import PipelineOrchestrator
@@ -15,10 +16,24 @@ from gent_disagreement_rag.core import PipelineOrchestrator
 
 def main():
     """Main execution function."""
+    parser = argparse.ArgumentParser(description="Run the episode processing pipeline.")
+    parser.add_argument(
+        "--stage",
+        choices=["all", "format"],
+        default="all",
+        help="'all' runs the full pipeline; 'format' only reformats existing raw transcripts",
+    )
+    parser.add_argument(
+        "--offline-embeddings",
+        action="store_true",
+        help="Embed through the OpenAI Batch API: half the cost, but may take up to 24 hours",
+    )
+    args = parser.parse_args()
+
     # Configure logging
     logging.basicConfig(
         level=logging.INFO,
-        format="%(levelname)s - %(message)s",
+        format="%(levelname)s - [%(threadName)s] %(message)s",
     )
 
     # Suppress noisy HTTP logs
@@ -26,9 +41,11 @@ def main():
     logging.getLogger("httpcore").setLevel(logging.WARNING)
     logging.getLogger("openai").setLevel(logging.WARNING)
 
-    orchestrator = PipelineOrchestrator()
-    orchestrator.process_episodes()
-    # orchestrator.format_existing_raw_transcripts()
+    orchestrator = PipelineOrchestrator(offline_embeddings=args.offline_embeddings)
+    if args.stage == "format":
+        orchestrator.format_existing_raw_transcripts()
+    else:
+        orchestrator.process_episodes()
 
 
 if __name__ == "__main__":
@@ -1,13 +1,20 @@
-import json
-import os
+import mmap
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
+
+import orjson
 
 
 def load_processed_segments(file_path: Path) -> List[Dict[str, Any]]:
     """
     Load processed segments from JSON file.
 
+    Parsed files are cached per process; the cache key includes the file's
+    modification time and size, so a rewritten file is parsed again. Each
+    call returns its own copies of the segment dictionaries, so callers may
+    modify them without affecting later loads.
+
     Args:
         file_path: Path to the JSON file.
 
@@ -17,8 +24,31 @@ def load_processed_segments(file_path: Path) -> List[Dict[str, Any]]:
     Raises:
         FileNotFoundError: If the specified file doesn't exist.
     """
-    if not file_path.exists():
-        raise FileNotFoundError(f"Processed segments file not found: {file_path}")
+    # One stat both checks existence and supplies the cache key
+    try:
+        stat = file_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(
+            f"Processed segments file not found: {file_path}"
+        ) from None
+
+    # Segments hold only strings, so a shallow copy of each dict is enough
+    return [
+        dict(segment)
+        for segment in _load_segments_cached(
+            str(file_path.resolve()), stat.st_mtime_ns, stat.st_size
+        )
+    ]
+
 
-    with open(file_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+@lru_cache(maxsize=8)
+def _load_segments_cached(
+    path: str, mtime_ns: int, size: int
+) -> Tuple[Dict[str, Any], ...]:
+    """Parse a segments file; mtime_ns and size only serve as cache keys."""
+    # Parse straight from the page cache instead of copying the file into a
+    # bytes object first
+    with open(path, "rb") as f, mmap.mmap(
+        f.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mapped, memoryview(mapped) as view:
+        return tuple(orjson.loads(view))
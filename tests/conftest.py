@@ -1,12 +1,31 @@
 """Pytest configuration and shared fixtures for the test suite."""
 
 import pytest
+import base64
 import json
+import zlib
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
+import numpy as np
+import orjson
 from faker import Faker
 
+from gent_disagreement_rag.utils.data_loader import _load_segments_cached
+
 fake = Faker()
+fake.seed_instance(0)
+
+# Recorded Deepgram response replayed by the transcription fixtures
+DEEPGRAM_RECORDING = Path(__file__).parent / "fixtures" / "sample_transcript.json"
+
+
+@pytest.fixture(autouse=True)
+def clear_segment_cache():
+    """Keep parsed segment files from leaking between tests."""
+    _load_segments_cached.cache_clear()
+    yield
+    _load_segments_cached.cache_clear()
 
 
 # Database fixtures
@@ -32,83 +51,174 @@ def clean_db_env(monkeypatch):
 
 
 # API mocking fixtures
+
+class FakeOpenAIClient:
+    """Minimal stand-in for the OpenAI client's embeddings, files and batches APIs.
+
+    Every text gets its own deterministic vector (see embedding_for), so tests
+    can check which embedding ended up where. Batch jobs complete on the
+    first status check.
+    """
+
+    def __init__(self):
+        self.embeddings = SimpleNamespace(create=MagicMock(side_effect=self._create))
+        self.files = SimpleNamespace(
+            create=MagicMock(side_effect=self._create_file),
+            content=MagicMock(side_effect=self._file_content),
+        )
+        self.batches = SimpleNamespace(
+            create=MagicMock(side_effect=self._create_batch),
+            retrieve=MagicMock(side_effect=self._retrieve_batch),
+        )
+        self._files = {}
+
+    @staticmethod
+    def embedding_for(text):
+        """The vector returned for text (text-embedding-3-small size)."""
+        seed = zlib.crc32(text.encode("utf-8"))
+        return np.random.default_rng(seed).random(1536, dtype=np.float32)
+
+    def _embedding_data(self, texts, encoding_format):
+        # The service asks for base64 on batched calls, as the real API allows
+        return [
+            {
+                "index": i,
+                "embedding": (
+                    base64.b64encode(self.embedding_for(text).tobytes()).decode()
+                    if encoding_format == "base64"
+                    else self.embedding_for(text).tolist()
+                ),
+            }
+            for i, text in enumerate(texts)
+        ]
+
+    def _create(self, model, input, encoding_format=None):
+        texts = [input] if isinstance(input, str) else input
+        return SimpleNamespace(
+            data=[
+                SimpleNamespace(**item)
+                for item in self._embedding_data(texts, encoding_format)
+            ]
+        )
+
+    def _create_file(self, file, purpose):
+        file_id = f"file-{len(self._files)}"
+        self._files[file_id] = file[1]
+        return SimpleNamespace(id=file_id)
+
+    def _file_content(self, file_id):
+        return SimpleNamespace(content=self._files[file_id])
+
+    def _create_batch(self, input_file_id, endpoint, completion_window):
+        return SimpleNamespace(
+            id=f"batch-{input_file_id}",
+            status="validating",
+            input_file_id=input_file_id,
+            output_file_id=None,
+        )
+
+    def _retrieve_batch(self, batch_id):
+        input_file_id = batch_id.removeprefix("batch-")
+        output = b"".join(
+            orjson.dumps(
+                {
+                    "custom_id": request["custom_id"],
+                    "response": {
+                        "status_code": 200,
+                        "body": {
+                            "data": self._embedding_data(
+                                request["body"]["input"],
+                                request["body"].get("encoding_format"),
+                            )
+                        },
+                    },
+                    "error": None,
+                }
+            )
+            + b"\n"
+            for request in map(orjson.loads, self._files[input_file_id].splitlines())
+        )
+        output_file_id = f"{input_file_id}-output"
+        self._files[output_file_id] = output
+        return SimpleNamespace(
+            id=batch_id, status="completed", output_file_id=output_file_id
+        )
+
+
 @pytest.fixture
 def mock_openai_embeddings():
     """Mock OpenAI embeddings API responses."""
-    with patch('openai.OpenAI') as mock_openai:
-        mock_client = MagicMock()
-        mock_openai.return_value = mock_client
+    fake_client = FakeOpenAIClient()
+    with patch(
+        'gent_disagreement_rag.core.embedding_service._get_openai_client',
+        return_value=fake_client,
+    ):
+        yield fake_client
 
-        # Default embedding response
-        mock_response = MagicMock()
-        mock_response.data = [MagicMock(embedding=[0.1] * 1536)]  # text-embedding-3-small size
-        mock_client.embeddings.create.return_value = mock_response
 
-        yield mock_client
+@pytest.fixture(scope="session")
+def deepgram_recorded_response():
+    """Canned Deepgram prerecorded response, parsed once per session."""
+    return json.loads(DEEPGRAM_RECORDING.read_text())
 
 
 @pytest.fixture
-def mock_deepgram_client():
-    """Mock Deepgram client for transcription testing."""
-    with patch('deepgram.DeepgramClient') as mock_client:
-        mock_instance = MagicMock()
-        mock_client.return_value = mock_instance
+def deepgram_response(deepgram_recorded_response):
+    """SDK response stand-in that replays the recording via to_dict()."""
+    return SimpleNamespace(to_dict=lambda: deepgram_recorded_response)
 
-        # Default transcription response structure
-        mock_response = {
-            "results": {
-                "channels": [
-                    {
-                        "alternatives": [
-                            {
-                                "paragraphs": {
-                                    "paragraphs": [
-                                        {
-                                            "speaker": "0",
-                                            "sentences": [
-                                                {"text": "Sample transcribed text."}
-                                            ]
-                                        }
-                                    ]
-                                }
-                            }
-                        ]
-                    }
-                ]
-            }
-        }
 
-        mock_instance.listen.prerecorded.v.return_value = mock_response
+@pytest.fixture
+def mock_deepgram_client(deepgram_response):
+    """Mock Deepgram client that replays the recorded transcription response."""
+    with patch('gent_disagreement_rag.core.audio_transcriber.DeepgramClient') as mock_client:
+        mock_instance = MagicMock()
+        mock_client.return_value = mock_instance
+        mock_instance.listen.rest.v.return_value.transcribe_file.return_value = deepgram_response
         yield mock_instance
 
 
 # Data fixtures
+@pytest.fixture(scope="session")
+def paragraph_pool():
+    """Paragraphs generated once per session for the segment fixtures."""
+    return [fake.paragraph() for _ in range(32)]
+
+
 @pytest.fixture
-def sample_segments():
+def sample_segments(paragraph_pool):
     """Generate sample transcript segments."""
+    # A fresh generator per test, so the picks don't depend on test order
+    rng = np.random.default_rng(seed=0)
+    first, second, third = rng.choice(len(paragraph_pool), size=3, replace=False)
     return [
-        {"speaker": "Ricky Ghoshroy", "text": fake.paragraph()},
-        {"speaker": "Brendan Kelly", "text": fake.paragraph()},
-        {"speaker": "Ricky Ghoshroy", "text": fake.paragraph()},
+        {"speaker": "Ricky Ghoshroy", "text": paragraph_pool[first]},
+        {"speaker": "Brendan Kelly", "text": paragraph_pool[second]},
+        {"speaker": "Ricky Ghoshroy", "text": paragraph_pool[third]},
     ]
 
 
 @pytest.fixture
 def sample_embeddings(sample_segments):
     """Generate sample embeddings for segments."""
+    rng = np.random.default_rng(seed=0)
+    vectors = rng.uniform(-1.0, 1.0, size=(len(sample_segments), 1536))
     embeddings = []
-    for segment in sample_segments:
+    for segment, vector in zip(sample_segments, vectors):
         embeddings.append({
             "speaker": segment["speaker"],
             "text": segment["text"],
-            "embedding": [fake.random.uniform(-1, 1) for _ in range(1536)]
+            "embedding": vector.tolist()
         })
     return embeddings
 
 
-@pytest.fixture
-def sample_transcript_file(tmp_path):
-    """Create a sample transcript JSON file for testing."""
+@pytest.fixture(scope="session")
+def sample_transcript_file(tmp_path_factory):
+    """Create a sample transcript JSON file, written once per test session.
+
+    The file is shared by every test that requests it; treat it as read-only.
+    """
     transcript_data = {
         "results": {
             "channels": [
@@ -140,8 +250,8 @@ def sample_transcript_file(tmp_path):
         }
     }
 
-    transcript_file = tmp_path / "sample_transcript.json"
-    transcript_file.write_text(json.dumps(transcript_data))
+    transcript_file = tmp_path_factory.mktemp("transcripts") / "sample_transcript.json"
+    transcript_file.write_bytes(orjson.dumps(transcript_data))
     return transcript_file
 
 
@@ -187,7 +297,13 @@ def create_mock_audio_file(audio_dir: Path, filename: str = "test.mp3") -> Path:
 
 
 def assert_valid_embedding(embedding):
-    """Assert that an embedding is valid."""
+    """Assert that an embedding is valid (a float list or a float ndarray)."""
+    if isinstance(embedding, np.ndarray):
+        # dtype guarantees every element's type; no per-element check needed
+        assert embedding.shape == (1536,)  # text-embedding-3-small dimension
+        assert embedding.dtype.kind in "fi"
+        return
+
     assert isinstance(embedding, list)
     assert len(embedding) == 1536  # text-embedding-3-small dimension
     assert all(isinstance(x, (int, float)) for x in embedding)
\ No newline at end of file
@@ -0,0 +1,122 @@
+"""Integration tests for DatabaseManager against a test database."""
+
+import os
+import uuid
+
+import numpy as np
+import pytest
+
+from gent_disagreement_rag.core import DatabaseManager
+from gent_disagreement_rag.core.database_manager import COPY_MIN_ROWS
+
+
+@pytest.mark.db
+class TestStoreEmbeddings:
+    """Tests for DatabaseManager.store_embeddings against a test database.
+
+    Set TEST_DB_NAME (plus the usual DB_* variables) to a scratch database
+    created with seed-db to run them; they are skipped otherwise.
+    """
+
+    @pytest.fixture
+    def db_manager(self):
+        """DatabaseManager connected to the test database."""
+        test_db_name = os.getenv("TEST_DB_NAME")
+        if not test_db_name:
+            pytest.skip("TEST_DB_NAME not set")
+
+        db_manager = DatabaseManager(database=test_db_name)
+        db_manager.validate_connection()
+        yield db_manager
+        db_manager.close()
+
+    @pytest.fixture
+    def episode_id(self, db_manager):
+        """A throwaway episode row, removed with its segments afterwards."""
+        with db_manager.connection() as conn, conn.cursor() as cursor:
+            cursor.execute(
+                "INSERT INTO episodes (episode_number) VALUES (%s) RETURNING id",
+                (f"test-{uuid.uuid4().hex[:12]}",),
+            )
+            episode_id = cursor.fetchone()[0]
+            conn.commit()
+
+        yield episode_id
+
+        with db_manager.connection() as conn, conn.cursor() as cursor:
+            cursor.execute(
+                "DELETE FROM transcript_segments WHERE episode_id = %s", (episode_id,)
+            )
+            cursor.execute("DELETE FROM episodes WHERE id = %s", (episode_id,))
+            conn.commit()
+
+    @staticmethod
+    def _segments(count, text_prefix):
+        return [
+            {
+                "speaker": "Ricky Ghoshroy",
+                "text": f"{text_prefix} {i}",
+                "embedding": np.full(1536, 0.1, dtype=np.float32),
+            }
+            for i in range(count)
+        ]
+
+    @staticmethod
+    def _stored_rows(db_manager, episode_id):
+        with db_manager.connection() as conn, conn.cursor() as cursor:
+            cursor.execute(
+                "SELECT segment_index, text FROM transcript_segments "
+                "WHERE episode_id = %s ORDER BY segment_index",
+                (episode_id,),
+            )
+            rows = cursor.fetchall()
+            conn.commit()
+        return rows
+
+    @pytest.mark.parametrize("first_count", [5, COPY_MIN_ROWS + 5])
+    def test_rerun_with_fewer_segments_removes_stale_rows(
+        self, db_manager, episode_id, first_count
+    ):
+        """Test that re-storing an episode with fewer segments leaves no stale rows."""
+        db_manager.store_embeddings(self._segments(first_count, "first"), episode_id)
+        db_manager.store_embeddings(self._segments(3, "second"), episode_id)
+
+        assert self._stored_rows(db_manager, episode_id) == [
+            (0, "second 0"),
+            (1, "second 1"),
+            (2, "second 2"),
+        ]
+
+    def test_rerun_with_same_segments_does_not_duplicate(self, db_manager, episode_id):
+        """Test that storing the same episode twice keeps one row per segment."""
+        segments = self._segments(COPY_MIN_ROWS + 5, "segment")
+        db_manager.store_embeddings(segments, episode_id)
+        db_manager.store_embeddings(segments, episode_id)
+
+        rows = self._stored_rows(db_manager, episode_id)
+        assert [index for index, _ in rows] == list(range(len(segments)))
+
+    @pytest.mark.parametrize("count", [3, COPY_MIN_ROWS + 5])
+    def test_store_none_embedding(self, db_manager, episode_id, count):
+        """Test that a None embedding is stored as NULL on both the INSERT and COPY paths."""
+        segments = self._segments(count, "segment")
+        segments[1]["embedding"] = None
+        db_manager.store_embeddings(segments, episode_id)
+
+        with db_manager.connection() as conn, conn.cursor() as cursor:
+            cursor.execute(
+                "SELECT segment_index FROM transcript_segments "
+                "WHERE episode_id = %s AND embedding IS NULL",
+                (episode_id,),
+            )
+            null_rows = cursor.fetchall()
+            conn.commit()
+        assert null_rows == [(1,)]
+
+    def test_store_list_embeddings(self, db_manager, episode_id, sample_embeddings):
+        """Test that embeddings given as float lists are stored with their segments."""
+        db_manager.store_embeddings(sample_embeddings, episode_id)
+
+        assert self._stored_rows(db_manager, episode_id) == [
+            (i, embedding["text"]) for i, embedding in enumerate(sample_embeddings)
+        ]
@@ -23,45 +23,10 @@ class TestAudioTranscriber:
         monkeypatch.setenv("AUDIO_TRANSCRIBER_OUTPUT_DIR", str(output_dir))
         return {"audio_dir": audio_dir, "output_dir": output_dir}
 
-    @pytest.fixture
-    def mock_deepgram_response(self):
-        """Mock Deepgram API response."""
-        mock_response = MagicMock()
-        mock_response.to_json.return_value = json.dumps(
-            {
-                "metadata": {"request_id": "test-123", "duration": 120.5},
-                "results": {
-                    "channels": [
-                        {
-                            "alternatives": [
-                                {
-                                    "transcript": "Hello world test transcript",
-                                    "confidence": 0.95,
-                                    "paragraphs": {
-                                        "paragraphs": [
-                                            {
-                                                "speaker": "0",
-                                                "sentences": [
-                                                    {
-                                                        "text": "Hello world test transcript"
-                                                    }
-                                                ],
-                                            }
-                                        ]
-                                    },
-                                }
-                            ]
-                        }
-                    ]
-                },
-            }
-        )
-        return mock_response
-
     # ===== INITIALIZATION TESTS =====
 
-    @patch("gent_disagreement_rag.core.audio_transcriber.load_dotenv")
-    def test_initialization_success(self, mock_load_dotenv, valid_env_vars):
+    @patch("gent_disagreement_rag.core.audio_transcriber.load_env")
+    def test_initialization_success(self, mock_load_env, valid_env_vars):
         """Test successful AudioTranscriber initialization."""
         transcriber = AudioTranscriber()
 
@@ -70,11 +35,11 @@ class TestAudioTranscriber:
         assert transcriber.language == "en"
         assert transcriber.audio_dir == valid_env_vars["audio_dir"]
         assert transcriber.output_dir == valid_env_vars["output_dir"]
-        mock_load_dotenv.assert_called_once()
+        mock_load_env.assert_called_once()
 
-    @patch("gent_disagreement_rag.core.audio_transcriber.load_dotenv")
+    @patch("gent_disagreement_rag.core.audio_transcriber.load_env")
     def test_initialization_creates_output_directory(
-        self, mock_load_dotenv, monkeypatch, tmp_path
+        self, mock_load_env, monkeypatch, tmp_path
     ):
         """Test that initialization creates output directory if it doesn't exist."""
         audio_dir = tmp_path / "audio"
@@ -92,9 +57,9 @@ class TestAudioTranscriber:
 
     # ===== API KEY VALIDATION TESTS =====
 
-    @patch("gent_disagreement_rag.core.audio_transcriber.load_dotenv")
+    @patch("gent_disagreement_rag.core.audio_transcriber.load_env")
     def test_missing_api_key_raises_error(
-        self, mock_load_dotenv, monkeypatch, tmp_path
+        self, mock_load_env, monkeypatch, tmp_path
     ):
         """Test that missing API key raises ValueError."""
         audio_dir = tmp_path / "audio"
@@ -111,8 +76,8 @@ class TestAudioTranscriber:
         ):
             AudioTranscriber()
 
-    @patch("gent_disagreement_rag.core.audio_transcriber.load_dotenv")
-    def test_empty_api_key_raises_error(self, mock_load_dotenv, monkeypatch, tmp_path):
+    @patch("gent_disagreement_rag.core.audio_transcriber.load_env")
+    def test_empty_api_key_raises_error(self, mock_load_env, monkeypatch, tmp_path):
         """Test that empty API key raises ValueError."""
         audio_dir = tmp_path / "audio"
         output_dir = tmp_path / "output"
@@ -126,8 +91,8 @@ class TestAudioTranscriber:
         with pytest.raises(ValueError, match="DEEPGRAM_API_KEY is empty"):
             AudioTranscriber()
 
-    @patch("gent_disagreement_rag.core.audio_transcriber.load_dotenv")
-    def test_short_api_key_raises_error(self, mock_load_dotenv, monkeypatch, tmp_path):
+    @patch("gent_disagreement_rag.core.audio_transcriber.load_env")
+    def test_short_api_key_raises_error(self, mock_load_env, monkeypatch, tmp_path):
         """Test that too-short API key raises ValueError."""
         audio_dir = tmp_path / "audio"
         output_dir = tmp_path / "output"
@@ -145,8 +110,8 @@ class TestAudioTranscriber:
 
     # ===== FILE VALIDATION TESTS =====
 
-    @patch("gent_disagreement_rag.core.audio_transcriber.load_dotenv")
-    def test_validate_audio_file_exists(self, mock_load_dotenv, valid_env_vars):
+    @patch("gent_disagreement_rag.core.audio_transcriber.load_env")
+    def test_validate_audio_file_exists(self, mock_load_env, valid_env_vars):
         """Test file validation passes when file exists."""
         transcriber = AudioTranscriber()
 
@@ -157,8 +122,8 @@ class TestAudioTranscriber:
         # Should not raise any exception
         transcriber._validate_audio_file(test_audio_file)
 
-    @patch("gent_disagreement_rag.core.audio_transcriber.load_dotenv")
-    def test_validate_audio_file_not_found(self, mock_load_dotenv, valid_env_vars):
+    @patch("gent_disagreement_rag.core.audio_transcriber.load_env")
+    def test_validate_audio_file_not_found(self, mock_load_env, valid_env_vars):
         """Test file validation raises error when file doesn't exist."""
         transcriber = AudioTranscriber()
 
@@ -169,40 +134,67 @@ class TestAudioTranscriber:
 
     # ===== DEEPGRAM CLIENT CREATION TESTS =====
 
-    @patch("gent_disagreement_rag.core.audio_transcriber.load_dotenv")
+    @patch("gent_disagreement_rag.core.audio_transcriber.load_env")
     @patch("gent_disagreement_rag.core.audio_transcriber.DeepgramClient")
-    def test_create_deepgram_client_success(
-        self, mock_deepgram_client, mock_load_dotenv, valid_env_vars
+    def test_initialization_creates_deepgram_client(
+        self, mock_deepgram_client, mock_load_env, valid_env_vars
     ):
-        """Test successful Deepgram client creation."""
+        """Test the Deepgram client is created once during initialization."""
         mock_client_instance = MagicMock()
         mock_deepgram_client.return_value = mock_client_instance
 
         transcriber = AudioTranscriber()
-        client = transcriber._create_deepgram_client()
 
-        mock_deepgram_client.assert_called_with("valid-api-key-1234567890")
-        assert client == mock_client_instance
+        mock_deepgram_client.assert_called_once_with("valid-api-key-1234567890")
+        assert transcriber.client == mock_client_instance
 
-    @patch("gent_disagreement_rag.core.audio_transcriber.load_dotenv")
+    @patch("gent_disagreement_rag.core.audio_transcriber.load_env")
     @patch("gent_disagreement_rag.core.audio_transcriber.DeepgramClient")
-    def test_create_deepgram_client_failure(
-        self, mock_deepgram_client, mock_load_dotenv, valid_env_vars
+    def test_initialization_client_creation_failure(
+        self, mock_deepgram_client, mock_load_env, valid_env_vars
     ):
         """Test Deepgram client creation failure handling."""
         mock_deepgram_client.side_effect = Exception("Client creation failed")
 
+        with pytest.raises(RuntimeError, match="Failed to create Deepgram client"):
+            AudioTranscriber()
+
+    @patch("gent_disagreement_rag.core.audio_transcriber.load_env")
+    @patch("gent_disagreement_rag.core.audio_transcriber.DeepgramClient")
+    def test_client_reused_across_transcriptions(
+        self,
+        mock_deepgram_client,
+        mock_load_env,
+        valid_env_vars,
+        deepgram_response,
+    ):
+        """Test that repeated transcriptions share a single Deepgram client."""
+        mock_client_instance = MagicMock()
+        mock_deepgram_client.return_value = mock_client_instance
+        mock_client_instance.listen.rest.v.return_value.transcribe_file.return_value = (
+            deepgram_response
+        )
+
+        for name in ("first.mp3", "second.mp3"):
+            (valid_env_vars["audio_dir"] / name).write_bytes(b"fake audio content")
+
         transcriber = AudioTranscriber()
+        transcriber.generate_transcript("first.mp3")
+        transcriber.generate_transcript("second.mp3")
 
-        with pytest.raises(RuntimeError, match="Failed to create Deepgram client"):
-            transcriber._create_deepgram_client()
+        mock_deepgram_client.assert_called_once()
 
     # ===== AUDIO TRANSCRIPTION TESTS =====
 
-    @patch("gent_disagreement_rag.core.audio_transcriber.load_dotenv")
+    @patch("gent_disagreement_rag.core.audio_transcriber.load_env")
     @patch("builtins.open", new_callable=mock_open, read_data=b"fake audio content")
     def test_transcribe_audio_file_success(
-        self, mock_file_open, mock_load_dotenv, valid_env_vars, mock_deepgram_response
+        self,
+        mock_file_open,
+        mock_load_env,
+        valid_env_vars,
+        mock_deepgram_client,
+        deepgram_response,
     ):
         """Test successful audio transcription."""
         transcriber = AudioTranscriber()
@@ -211,62 +203,53 @@ class TestAudioTranscriber:
         test_audio_file = valid_env_vars["audio_dir"] / "test.mp3"
         test_audio_file.write_bytes(b"fake audio content")
 
-        # Mock client
-        mock_client = MagicMock()
-        mock_client.listen.rest.v.return_value.transcribe_file.return_value = (
-            mock_deepgram_response
-        )
+        result = transcriber._transcribe_audio_file(test_audio_file)
 
-        result = transcriber._transcribe_audio_file(mock_client, test_audio_file)
+        assert result == deepgram_response
+        mock_deepgram_client.listen.rest.v.assert_called_with("1")
+        transcribe_file = mock_deepgram_client.listen.rest.v.return_value.transcribe_file
+        transcribe_file.assert_called_once()
 
-        assert result == mock_deepgram_response
-        mock_client.listen.rest.v.assert_called_with("1")
-        mock_client.listen.rest.v.return_value.transcribe_file.assert_called_once()
+        # Audio is handed to the SDK as a stream, not a preloaded buffer
+        source = transcribe_file.call_args[0][0]
+        assert "stream" in source
 
     # ===== TRANSCRIPT SAVING TESTS =====
 
-    @patch("gent_disagreement_rag.core.audio_transcriber.load_dotenv")
-    @patch("builtins.open", new_callable=mock_open)
+    @patch("gent_disagreement_rag.core.audio_transcriber.load_env")
     def test_save_transcript_success(
-        self, mock_file_open, mock_load_dotenv, valid_env_vars, mock_deepgram_response
+        self,
+        mock_load_env,
+        valid_env_vars,
+        deepgram_response,
+        deepgram_recorded_response,
     ):
         """Test successful transcript saving."""
         transcriber = AudioTranscriber()
 
-        output_path = transcriber._save_transcript(
-            mock_deepgram_response, "test_episode"
-        )
+        output_path = transcriber._save_transcript(deepgram_response, "test_episode")
 
         expected_path = valid_env_vars["output_dir"] / "test_episode.json"
         assert output_path == expected_path
 
-        # Verify file was opened for writing
-        mock_file_open.assert_called_with(expected_path, "w")
+        # Verify the response dict was written as JSON
+        with open(expected_path) as f:
+            assert json.load(f) == deepgram_recorded_response
 
-        # Verify JSON content was written
-        mock_deepgram_response.to_json.assert_called_with(indent=4)
+        # Verify the temporary file was renamed into place
+        assert list(valid_env_vars["output_dir"].iterdir()) == [expected_path]
 
     # ===== INTEGRATION TESTS (generate_transcript) =====
 
-    @patch("gent_disagreement_rag.core.audio_transcriber.load_dotenv")
-    @patch("gent_disagreement_rag.core.audio_transcriber.DeepgramClient")
-    @patch("builtins.open", new_callable=mock_open, read_data=b"fake audio content")
+    @patch("gent_disagreement_rag.core.audio_transcriber.load_env")
     def test_generate_transcript_complete_success(
         self,
-        mock_file_open,
-        mock_deepgram_client,
-        mock_load_dotenv,
+        mock_load_env,
         valid_env_vars,
-        mock_deepgram_response,
+        mock_deepgram_client,
+        deepgram_recorded_response,
     ):
         """Test complete successful transcript generation workflow."""
-        # Setup mocks
-        mock_client_instance = MagicMock()
-        mock_deepgram_client.return_value = mock_client_instance
-        mock_client_instance.listen.rest.v.return_value.transcribe_file.return_value = (
-            mock_deepgram_response
-        )
-
         # Create test audio file
         test_audio_file = valid_env_vars["audio_dir"] / "test.mp3"
         test_audio_file.write_bytes(b"fake audio content")
@@ -277,44 +260,42 @@ class TestAudioTranscriber:
         # Verify successful completion
         expected_output = valid_env_vars["output_dir"] / "test.json"
         assert result == expected_output
+        assert json.loads(expected_output.read_text()) == deepgram_recorded_response
 
-    @patch("gent_disagreement_rag.core.audio_transcriber.load_dotenv")
-    def test_generate_transcript_file_not_found(self, mock_load_dotenv, valid_env_vars):
-        """Test generate_transcript handles missing audio file gracefully."""
-        transcriber = AudioTranscriber()
-
-        result = transcriber.generate_transcript("nonexistent.mp3")
-
-        assert result is None
-
-    @patch("gent_disagreement_rag.core.audio_transcriber.load_dotenv")
+    @patch("gent_disagreement_rag.core.audio_transcriber.load_env")
     @patch("gent_disagreement_rag.core.audio_transcriber.DeepgramClient")
-    def test_generate_transcript_client_creation_failure(
-        self, mock_deepgram_client, mock_load_dotenv, valid_env_vars
+    def test_generate_transcript_skips_existing_transcript(
+        self, mock_deepgram_client, mock_load_env, valid_env_vars
     ):
-        """Test generate_transcript handles client creation failure gracefully."""
-        mock_deepgram_client.side_effect = Exception("Client creation failed")
+        """Test that an existing transcript is returned without calling Deepgram."""
+        mock_client_instance = MagicMock()
+        mock_deepgram_client.return_value = mock_client_instance
 
-        # Create test audio file
-        test_audio_file = valid_env_vars["audio_dir"] / "test.mp3"
-        test_audio_file.write_bytes(b"fake audio content")
+        existing = valid_env_vars["output_dir"] / "test.json"
+        existing.write_text('{"results": {}}')
 
         transcriber = AudioTranscriber()
         result = transcriber.generate_transcript("test.mp3")
 
+        assert result == existing
+        mock_client_instance.listen.rest.v.assert_not_called()
+
+    @patch("gent_disagreement_rag.core.audio_transcriber.load_env")
+    def test_generate_transcript_file_not_found(self, mock_load_env, valid_env_vars):
+        """Test generate_transcript handles missing audio file gracefully."""
+        transcriber = AudioTranscriber()
+
+        result = transcriber.generate_transcript("nonexistent.mp3")
+
         assert result is None
 
-    @patch("gent_disagreement_rag.core.audio_transcriber.load_dotenv")
-    @patch("gent_disagreement_rag.core.audio_transcriber.DeepgramClient")
+    @patch("gent_disagreement_rag.core.audio_transcriber.load_env")
     @patch("builtins.open", new_callable=mock_open, read_data=b"fake audio content")
     def test_generate_transcript_api_failure(
-        self, mock_file_open, mock_deepgram_client, mock_load_dotenv, valid_env_vars
+        self, mock_file_open, mock_load_env, valid_env_vars, mock_deepgram_client
     ):
         """Test generate_transcript handles API failure gracefully."""
-        # Setup mocks
-        mock_client_instance = MagicMock()
-        mock_deepgram_client.return_value = mock_client_instance
-        mock_client_instance.listen.rest.v.return_value.transcribe_file.side_effect = (
+        mock_deepgram_client.listen.rest.v.return_value.transcribe_file.side_effect = (
             Exception("API Error")
         )
 
@@ -327,25 +308,12 @@ class TestAudioTranscriber:
 
         assert result is None
 
-    @patch("gent_disagreement_rag.core.audio_transcriber.load_dotenv")
-    @patch("gent_disagreement_rag.core.audio_transcriber.DeepgramClient")
+    @patch("gent_disagreement_rag.core.audio_transcriber.load_env")
     @patch("builtins.open", new_callable=mock_open, read_data=b"fake audio content")
     def test_generate_transcript_save_failure(
-        self,
-        mock_file_open,
-        mock_deepgram_client,
-        mock_load_dotenv,
-        valid_env_vars,
-        mock_deepgram_response,
+        self, mock_file_open, mock_load_env, valid_env_vars, mock_deepgram_client
     ):
         """Test generate_transcript handles save failure gracefully."""
-        # Setup mocks
-        mock_client_instance = MagicMock()
-        mock_deepgram_client.return_value = mock_client_instance
-        mock_client_instance.listen.rest.v.return_value.transcribe_file.return_value = (
-            mock_deepgram_response
-        )
-
         # Make file writing fail
         mock_file_open.side_effect = [
             mock_open(
@@ -365,9 +333,9 @@ class TestAudioTranscriber:
 
     # ===== CONFIGURATION TESTS =====
 
-    @patch("gent_disagreement_rag.core.audio_transcriber.load_dotenv")
+    @patch("gent_disagreement_rag.core.audio_transcriber.load_env")
     def test_transcription_options_configuration(
-        self, mock_load_dotenv, valid_env_vars
+        self, mock_load_env, valid_env_vars
     ):
         """Test that transcription options are configured correctly."""
         transcriber = AudioTranscriber()
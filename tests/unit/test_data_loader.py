@@ -0,0 +1,49 @@
+"""Unit tests for the processed segment loader."""
+
+import orjson
+import pytest
+
+from gent_disagreement_rag.utils import load_processed_segments
+
+
+class TestLoadProcessedSegments:
+    """Test suite for load_processed_segments."""
+
+    @pytest.fixture
+    def segments_file(self, tmp_path, sample_segments):
+        """A processed segments file holding sample_segments."""
+        path = tmp_path / "processed.json"
+        path.write_bytes(orjson.dumps(sample_segments))
+        return path
+
+    def test_loads_segments(self, segments_file, sample_segments):
+        """Test that the file's segments are returned in order."""
+        assert load_processed_segments(segments_file) == sample_segments
+
+    def test_mutating_result_does_not_affect_later_loads(
+        self, segments_file, sample_segments
+    ):
+        """Test that cached segments are not shared with callers."""
+        first = load_processed_segments(segments_file)
+        first[0]["text"] = "changed"
+        first.append({"speaker": "x", "text": "extra"})
+
+        assert load_processed_segments(segments_file) == sample_segments
+
+    def test_rewritten_file_is_reloaded(self, segments_file):
+        """Test that a changed file is parsed again rather than served from cache."""
+        load_processed_segments(segments_file)
+        segments_file.write_bytes(
+            orjson.dumps([{"speaker": "Brendan Kelly", "text": "A new, longer segment."}])
+        )
+
+        assert load_processed_segments(segments_file) == [
+            {"speaker": "Brendan Kelly", "text": "A new, longer segment."}
+        ]
+
+    def test_missing_file_raises(self, tmp_path):
+        """Test that a missing file raises FileNotFoundError with its path."""
+        missing = tmp_path / "missing.json"
+
+        with pytest.raises(FileNotFoundError, match="Processed segments file not found"):
+            load_processed_segments(missing)
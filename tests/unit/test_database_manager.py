@@ -0,0 +1,101 @@
+"""Unit tests for DatabaseManager."""
+
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from gent_disagreement_rag.core import DatabaseManager
+from gent_disagreement_rag.core.database_manager import (
+    _build_segment_copy_buffer,
+    _vector_literal,
+)
+
+
+class TestPoolConfiguration:
+    """Tests for the DB_POOL_MAX setting."""
+
+    @pytest.fixture(autouse=True)
+    def no_dotenv(self):
+        """Keep a local .env from overriding the test environment."""
+        with patch("gent_disagreement_rag.core.database_manager.load_env"):
+            yield
+
+    def test_default_pool_size(self, clean_db_env, monkeypatch):
+        """Test the default pool size when DB_POOL_MAX is unset."""
+        monkeypatch.delenv("DB_POOL_MAX", raising=False)
+
+        assert DatabaseManager().pool_max_connections == 8
+
+    @pytest.mark.parametrize("value", ["0", "many"])
+    def test_invalid_pool_size_raises(self, clean_db_env, monkeypatch, value):
+        """Test that DB_POOL_MAX must be a positive integer."""
+        monkeypatch.setenv("DB_POOL_MAX", value)
+
+        with pytest.raises(ValueError, match="DB_POOL_MAX"):
+            DatabaseManager()
+
+
+class TestSegmentCopyBuffer:
+    """Byte-level tests for the binary COPY encoding of segment rows."""
+
+    HEADER = b"PGCOPY\n\xff\r\n\x00" + b"\x00\x00\x00\x00" + b"\x00\x00\x00\x00"
+    TRAILER = b"\xff\xff"
+
+    def test_encodes_rows(self):
+        """Test the header, per-field framing, halfvec layout, NULLs and trailer."""
+        buffer = _build_segment_copy_buffer(
+            [
+                {"speaker": "A", "text": "hi", "embedding": np.array([0.5, -1.0])},
+                {"speaker": "Bé", "text": "", "embedding": None},
+            ],
+            episode_id=7,
+        )
+
+        assert buffer.tell() == 0
+        assert buffer.getvalue() == (
+            self.HEADER
+            # Row 0: five fields
+            + b"\x00\x05"
+            + b"\x00\x00\x00\x01" + b"A"
+            + b"\x00\x00\x00\x02" + b"hi"
+            # halfvec: 8 bytes = int16 dim 2, int16 unused, float16 0.5 and -1.0
+            + b"\x00\x00\x00\x08" + b"\x00\x02" + b"\x00\x00" + b"\x38\x00\xbc\x00"
+            + b"\x00\x00\x00\x04" + b"\x00\x00\x00\x07"
+            + b"\x00\x00\x00\x04" + b"\x00\x00\x00\x00"
+            # Row 1: UTF-8 speaker, empty text, NULL embedding, segment_index 1
+            + b"\x00\x05"
+            + b"\x00\x00\x00\x03" + "Bé".encode("utf-8")
+            + b"\x00\x00\x00\x00"
+            + b"\xff\xff\xff\xff"
+            + b"\x00\x00\x00\x04" + b"\x00\x00\x00\x07"
+            + b"\x00\x00\x00\x04" + b"\x00\x00\x00\x01"
+            + self.TRAILER
+        )
+
+    def test_null_episode_id(self):
+        """Test that a missing episode_id is sent as NULL."""
+        buffer = _build_segment_copy_buffer(
+            [{"speaker": "A", "text": "hi", "embedding": None}], episode_id=None
+        )
+
+        row = buffer.getvalue()[len(self.HEADER) : -len(self.TRAILER)]
+        assert row.endswith(
+            b"\xff\xff\xff\xff" + b"\x00\x00\x00\x04" + b"\x00\x00\x00\x00"
+        )
+
+    def test_no_rows(self):
+        """Test that an empty batch is just the header and trailer."""
+        assert _build_segment_copy_buffer([], 1).getvalue() == self.HEADER + self.TRAILER
+
+
+class TestVectorLiteral:
+    """Tests for the text vector format used by small multi-row INSERTs."""
+
+    def test_formats_values(self):
+        """Test that values are written in pgvector's text input format."""
+        assert _vector_literal(np.array([0.5, -1.0])) == "[0.5,-1.0]"
+
+    def test_none_is_null(self):
+        """Test that a missing embedding is passed through as NULL, like COPY does."""
+        assert _vector_literal(None) is None
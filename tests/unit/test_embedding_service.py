@@ -0,0 +1,241 @@
+"""Unit tests for EmbeddingService."""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from gent_disagreement_rag.core import EmbeddingService
+from gent_disagreement_rag.core.embedding_service import (
+    EMBEDDING_MAX_REQUEST_TOKENS,
+    _batch_bounds,
+)
+from tests.conftest import assert_valid_embedding
+
+
+def _requested_inputs(fake_client):
+    """The input list of every embeddings.create call, in call order."""
+    return [
+        call.kwargs["input"] for call in fake_client.embeddings.create.call_args_list
+    ]
+
+
+class TestBatchBounds:
+    """Tests for the request slicing helper."""
+
+    def test_splits_on_batch_size(self):
+        """Test that no slice holds more than batch_size texts."""
+        assert list(_batch_bounds(["a"] * 5, batch_size=2)) == [(0, 2), (2, 4), (4, 5)]
+
+    def test_splits_on_token_cap(self):
+        """Test that a slice ends before its estimated tokens exceed max_tokens."""
+        texts = ["x" * 30] * 4  # 11 estimated tokens each
+
+        assert list(_batch_bounds(texts, batch_size=10, max_tokens=25)) == [
+            (0, 2),
+            (2, 4),
+        ]
+
+    def test_oversized_text_gets_its_own_slice(self):
+        """Test that a text over the token cap is still sent, alone."""
+        texts = ["short", "x" * 300, "short"]
+
+        assert list(_batch_bounds(texts, batch_size=10, max_tokens=50)) == [
+            (0, 1),
+            (1, 2),
+            (2, 3),
+        ]
+
+    def test_no_texts(self):
+        """Test that an empty input yields no slices."""
+        assert list(_batch_bounds([], batch_size=10)) == []
+
+
+class TestEmbeddingService:
+    """Test suite for EmbeddingService against a fake OpenAI client."""
+
+    @pytest.fixture
+    def service(self, monkeypatch, mock_openai_embeddings):
+        """EmbeddingService without a persistent cache."""
+        monkeypatch.delenv("EMBEDDING_CACHE_PATH", raising=False)
+        with patch("gent_disagreement_rag.core.embedding_service.load_env"):
+            return EmbeddingService()
+
+    # ===== SYNCHRONOUS BATCHING TESTS =====
+
+    def test_embed_batch_preserves_input_order(self, service, mock_openai_embeddings):
+        """Test that results line up with the inputs despite the length sort."""
+        texts = ["a much longer segment of text", "mid length", "x", "medium text"] * 3
+        texts = [f"{text} {i}" for i, text in enumerate(texts)]
+
+        embeddings = service.embed_batch(texts, batch_size=2)
+
+        assert len(embeddings) == len(texts)
+        for text, embedding in zip(texts, embeddings):
+            assert_valid_embedding(embedding)
+            np.testing.assert_array_equal(
+                embedding, mock_openai_embeddings.embedding_for(text)
+            )
+
+    def test_embed_batch_respects_batch_size(self, service, mock_openai_embeddings):
+        """Test that each request carries at most batch_size texts, sorted by length."""
+        texts = [f"segment {'word ' * (i % 7)}{i}" for i in range(25)]
+
+        service.embed_batch(texts, batch_size=4)
+
+        requests = _requested_inputs(mock_openai_embeddings)
+        assert len(requests) == 7
+        assert all(len(request) <= 4 for request in requests)
+        assert sorted(text for request in requests for text in request) == sorted(texts)
+        for request in requests:
+            assert [len(t) for t in request] == sorted(len(t) for t in request)
+
+    def test_embed_batch_respects_token_cap(self, service, mock_openai_embeddings):
+        """Test that long texts are split across requests under the token cap."""
+        # Each text is estimated at well over half the per-request token cap
+        long_text = "x" * (EMBEDDING_MAX_REQUEST_TOKENS * 2)
+        texts = [f"{long_text}{i}" for i in range(3)]
+
+        embeddings = service.embed_batch(texts)
+
+        assert [len(request) for request in _requested_inputs(mock_openai_embeddings)] == [
+            1,
+            1,
+            1,
+        ]
+        for text, embedding in zip(texts, embeddings):
+            np.testing.assert_array_equal(
+                embedding, mock_openai_embeddings.embedding_for(text)
+            )
+
+    def test_embed_batch_no_texts(self, service, mock_openai_embeddings):
+        """Test that an empty input makes no API calls."""
+        assert service.embed_batch([]) == []
+        mock_openai_embeddings.embeddings.create.assert_not_called()
+
+    def test_generate_embeddings_embeds_repeated_texts_once(
+        self, service, mock_openai_embeddings
+    ):
+        """Test that duplicate segment texts are sent once and shared."""
+        segments = [
+            {"speaker": "Ricky Ghoshroy", "text": "Yeah."},
+            {"speaker": "Brendan Kelly", "text": "I disagree entirely."},
+            {"speaker": "Ricky Ghoshroy", "text": "Right."},
+            {"speaker": "Brendan Kelly", "text": "Yeah."},
+        ]
+
+        results = service.generate_embeddings(segments)
+
+        assert _requested_inputs(mock_openai_embeddings) == [
+            ["Yeah.", "Right.", "I disagree entirely."]
+        ]
+        assert [(r["speaker"], r["text"]) for r in results] == [
+            (s["speaker"], s["text"]) for s in segments
+        ]
+        for result in results:
+            np.testing.assert_array_equal(
+                result["embedding"], mock_openai_embeddings.embedding_for(result["text"])
+            )
+
+    # ===== PERSISTENT CACHE TESTS =====
+
+    @pytest.fixture
+    def cached_service_factory(self, monkeypatch, tmp_path, mock_openai_embeddings):
+        """Build EmbeddingServices that share one on-disk cache."""
+        monkeypatch.setenv("EMBEDDING_CACHE_PATH", str(tmp_path / "embeddings.sqlite"))
+        services = []
+
+        def make():
+            with patch("gent_disagreement_rag.core.embedding_service.load_env"):
+                services.append(EmbeddingService())
+            return services[-1]
+
+        yield make
+        for service in services:
+            service.cache.close()
+
+    def test_cache_hits_skip_the_api(
+        self, cached_service_factory, mock_openai_embeddings, sample_segments
+    ):
+        """Test that a second run over the same segments makes no API calls."""
+        first = cached_service_factory().generate_embeddings(sample_segments)
+        mock_openai_embeddings.embeddings.create.reset_mock()
+
+        second = cached_service_factory().generate_embeddings(sample_segments)
+
+        mock_openai_embeddings.embeddings.create.assert_not_called()
+        for before, after in zip(first, second):
+            assert_valid_embedding(after["embedding"])
+            np.testing.assert_array_equal(before["embedding"], after["embedding"])
+
+    def test_cache_only_requests_new_texts(
+        self, cached_service_factory, mock_openai_embeddings, sample_segments
+    ):
+        """Test that only texts missing from the cache are sent to the API."""
+        service = cached_service_factory()
+        service.generate_embeddings(sample_segments[:2])
+        mock_openai_embeddings.embeddings.create.reset_mock()
+
+        results = service.generate_embeddings(sample_segments)
+
+        assert _requested_inputs(mock_openai_embeddings) == [[sample_segments[2]["text"]]]
+        for result in results:
+            np.testing.assert_array_equal(
+                result["embedding"], mock_openai_embeddings.embedding_for(result["text"])
+            )
+
+    # ===== BATCH API TESTS =====
+
+    @patch("gent_disagreement_rag.core.embedding_service.time.sleep")
+    def test_embed_batch_offline_reassembles_results(
+        self, mock_sleep, service, mock_openai_embeddings
+    ):
+        """Test that Batch API results are mapped back to their input positions."""
+        texts = [f"segment {i}" for i in range(7)]
+
+        embeddings = service.embed_batch_offline(texts, batch_size=3)
+
+        for text, embedding in zip(texts, embeddings):
+            np.testing.assert_array_equal(
+                embedding, mock_openai_embeddings.embedding_for(text)
+            )
+        # One JSONL line per request of at most batch_size texts
+        input_file = mock_openai_embeddings.files.create.call_args.kwargs["file"][1]
+        assert len(input_file.splitlines()) == 3
+        mock_sleep.assert_called_once()
+        mock_openai_embeddings.embeddings.create.assert_not_called()
+
+    @patch("gent_disagreement_rag.core.embedding_service.time.sleep")
+    def test_embed_batch_offline_failed_job_raises(
+        self, mock_sleep, service, mock_openai_embeddings
+    ):
+        """Test that a batch job that doesn't complete raises RuntimeError."""
+        mock_openai_embeddings.batches.retrieve.side_effect = (
+            lambda batch_id: SimpleNamespace(
+                id=batch_id, status="failed", output_file_id=None
+            )
+        )
+
+        with pytest.raises(RuntimeError, match="ended as failed"):
+            service.embed_batch_offline(["one", "two"])
+
+    def test_embed_batch_offline_no_texts(self, service, mock_openai_embeddings):
+        """Test that no batch job is submitted for an empty input."""
+        assert service.embed_batch_offline([]) == []
+        mock_openai_embeddings.batches.create.assert_not_called()
+
+    @patch("gent_disagreement_rag.core.embedding_service.time.sleep")
+    def test_generate_embeddings_offline(
+        self, mock_sleep, service, mock_openai_embeddings, sample_segments
+    ):
+        """Test that offline=True routes segments through the Batch API."""
+        results = service.generate_embeddings(sample_segments, offline=True)
+
+        assert [r["text"] for r in results] == [s["text"] for s in sample_segments]
+        for result in results:
+            np.testing.assert_array_equal(
+                result["embedding"], mock_openai_embeddings.embedding_for(result["text"])
+            )
+        mock_openai_embeddings.batches.create.assert_called_once()
+        mock_openai_embeddings.embeddings.create.assert_not_called()
@@ -0,0 +1,165 @@
+"""Unit tests for PipelineOrchestrator."""
+
+import logging
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from gent_disagreement_rag.core.pipeline_orchestrator import (
+    PROCESSING_CONCURRENCY,
+    PipelineOrchestrator,
+)
+
+MODULE = "gent_disagreement_rag.core.pipeline_orchestrator"
+
+
+@pytest.fixture
+def make_orchestrator():
+    """Build a PipelineOrchestrator with every service mocked out."""
+
+    def make(episodes, pool_max_connections=8, **kwargs):
+        with patch(f"{MODULE}.DatabaseManager") as mock_db_manager, patch(
+            f"{MODULE}.AudioTranscriber"
+        ), patch(f"{MODULE}.EmbeddingService"), patch(
+            f"{MODULE}.TranscriptExporter"
+        ), patch(
+            f"{MODULE}.TranscriptFormatter"
+        ), patch(
+            f"{MODULE}.load_episodes", return_value=episodes
+        ):
+            mock_db_manager.return_value.pool_max_connections = pool_max_connections
+            return PipelineOrchestrator(**kwargs)
+
+    return make
+
+
+class TestWorkerConfiguration:
+    """Tests for the PIPELINE_WORKERS setting."""
+
+    def test_default_workers(self, make_orchestrator, monkeypatch):
+        """Test that PROCESSING_CONCURRENCY is used when PIPELINE_WORKERS is unset."""
+        monkeypatch.delenv("PIPELINE_WORKERS", raising=False)
+
+        assert make_orchestrator([]).processing_workers == PROCESSING_CONCURRENCY
+
+    def test_workers_from_env(self, make_orchestrator, monkeypatch):
+        """Test that PIPELINE_WORKERS overrides the default."""
+        monkeypatch.setenv("PIPELINE_WORKERS", "5")
+
+        assert make_orchestrator([]).processing_workers == 5
+
+    @pytest.mark.parametrize("value", ["0", "-2", "two"])
+    def test_invalid_workers_raise(self, make_orchestrator, monkeypatch, value):
+        """Test that PIPELINE_WORKERS must be a positive integer."""
+        monkeypatch.setenv("PIPELINE_WORKERS", value)
+
+        with pytest.raises(ValueError, match="PIPELINE_WORKERS"):
+            make_orchestrator([])
+
+    def test_workers_capped_at_pool_size(self, make_orchestrator, monkeypatch, caplog):
+        """Test that there are never more workers than pooled connections."""
+        monkeypatch.setenv("PIPELINE_WORKERS", "12")
+
+        orchestrator = make_orchestrator([], pool_max_connections=4)
+
+        assert orchestrator.processing_workers == 4
+        assert "exceeds DB_POOL_MAX=4" in caplog.text
+
+
+class TestProcessEpisodes:
+    """Test suite for PipelineOrchestrator.process_episodes."""
+
+    @pytest.fixture
+    def episodes(self):
+        """Three pending episodes and one already processed."""
+        return [
+            {"episode_id": 1, "file_name": "ok.mp3", "speakers_map": {}},
+            {"episode_id": 2, "file_name": "no_transcript.mp3", "speakers_map": {}},
+            {"episode_id": 3, "file_name": "bad_embeddings.mp3", "speakers_map": {}},
+            {
+                "episode_id": 4,
+                "file_name": "done.mp3",
+                "speakers_map": {},
+                "processed": True,
+            },
+        ]
+
+    @pytest.fixture
+    def orchestrator(self, episodes, make_orchestrator):
+        """Orchestrator whose transcription fails for no_transcript.mp3."""
+        orchestrator = make_orchestrator(episodes)
+
+        orchestrator.audio_transcriber.generate_transcript.side_effect = (
+            lambda file_name: None
+            if file_name == "no_transcript.mp3"
+            else Path(f"/raw/{file_name}.json")
+        )
+        return orchestrator
+
+    def test_failures_do_not_lose_completed_episodes(
+        self, orchestrator, episodes, caplog
+    ):
+        """Test that successful episodes are saved before the first error is raised."""
+
+        def process(episode, raw_transcript_path):
+            if episode["file_name"] == "bad_embeddings.mp3":
+                raise RuntimeError("embedding failed")
+
+        orchestrator._process_single_episode = MagicMock(side_effect=process)
+
+        with patch(f"{MODULE}.save_episodes") as mock_save, caplog.at_level(logging.INFO):
+            with pytest.raises(RuntimeError):
+                orchestrator.process_episodes()
+
+        assert [ep.get("processed", False) for ep in episodes] == [
+            True,
+            False,
+            False,
+            True,
+        ]
+        mock_save.assert_called_once_with(episodes)
+        assert orchestrator._process_single_episode.call_count == 2
+        assert "✓ Transcribed 2 (no_transcript.mp3)" not in caplog.text
+        assert "✓ Transcribed 1 (ok.mp3)" in caplog.text
+
+    def test_all_episodes_succeed(self, orchestrator, episodes):
+        """Test that every pending episode is processed and saved."""
+        orchestrator.audio_transcriber.generate_transcript.side_effect = (
+            lambda file_name: Path(f"/raw/{file_name}.json")
+        )
+        orchestrator._process_single_episode = MagicMock()
+
+        with patch(f"{MODULE}.save_episodes") as mock_save:
+            orchestrator.process_episodes()
+
+        assert all(ep["processed"] for ep in episodes)
+        assert mock_save.call_count == 3
+        orchestrator._process_single_episode.assert_any_call(
+            episodes[0], Path("/raw/ok.mp3.json")
+        )
+
+
+class TestProcessSingleEpisode:
+    """Test suite for PipelineOrchestrator._process_single_episode."""
+
+    @pytest.mark.parametrize("offline", [False, True])
+    def test_offline_embeddings_flag_is_passed_through(
+        self, make_orchestrator, offline
+    ):
+        """Test that the offline_embeddings setting selects the embedding path."""
+        orchestrator = make_orchestrator([], offline_embeddings=offline)
+
+        segments = [{"speaker": "Ricky Ghoshroy", "text": "Hello."}]
+        orchestrator._format_and_export_raw_transcript = MagicMock(
+            return_value=Path("/processed/ep.json")
+        )
+        with patch(f"{MODULE}.load_processed_segments", return_value=segments):
+            orchestrator._process_single_episode(
+                {"episode_id": 1, "file_name": "ep.mp3", "speakers_map": {}},
+                Path("/raw/ep.json"),
+            )
+
+        orchestrator.embedding_service.generate_embeddings.assert_called_once_with(
+            segments, offline=offline
+        )
@@ -0,0 +1,61 @@
+"""Unit tests for TranscriptExporter."""
+
+import json
+
+import msgspec
+import pytest
+
+from gent_disagreement_rag.core import TranscriptExporter, TranscriptFormatter
+
+
+class TestTranscriptExporter:
+    """Test suite for TranscriptExporter.export_segments."""
+
+    @pytest.fixture
+    def exporter(self, tmp_path):
+        """Exporter writing to a temporary directory."""
+        return TranscriptExporter(output_dir=tmp_path)
+
+    def test_export_segments_writes_json(self, exporter, sample_segments):
+        """Test that exported segments round-trip through the JSON file."""
+        output_file = exporter.export_segments(iter(sample_segments), "episode")
+
+        assert output_file == exporter.output_dir / "episode.json"
+        assert json.loads(output_file.read_text()) == sample_segments
+
+    def test_export_no_segments_writes_empty_list(self, exporter):
+        """Test that an empty segment stream produces an empty JSON list."""
+        output_file = exporter.export_segments(iter([]), "episode")
+
+        assert json.loads(output_file.read_text()) == []
+
+    def test_failed_export_keeps_previous_file(self, exporter, sample_segments):
+        """Test that an error while streaming segments leaves the old export intact."""
+        output_file = exporter.export_segments(sample_segments, "episode")
+        previous = output_file.read_bytes()
+
+        def failing_segments():
+            yield sample_segments[0]
+            raise RuntimeError("formatter failed")
+
+        with pytest.raises(RuntimeError, match="formatter failed"):
+            exporter.export_segments(failing_segments(), "episode")
+
+        assert output_file.read_bytes() == previous
+        assert list(exporter.output_dir.iterdir()) == [output_file]
+
+    def test_invalid_transcript_keeps_previous_file(
+        self, exporter, sample_segments, tmp_path
+    ):
+        """Test that a malformed raw transcript doesn't truncate an existing export."""
+        output_file = exporter.export_segments(sample_segments, "episode")
+        previous = output_file.read_bytes()
+
+        raw_transcript = tmp_path / "raw.json"
+        raw_transcript.write_text('{"results": {}}')
+        segments = TranscriptFormatter().iter_segments(raw_transcript, {})
+
+        with pytest.raises(msgspec.ValidationError):
+            exporter.export_segments(segments, "episode")
+
+        assert output_file.read_bytes() == previous
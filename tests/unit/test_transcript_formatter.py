@@ -0,0 +1,169 @@
+"""Unit tests for TranscriptFormatter."""
+
+from pathlib import Path
+
+import msgspec
+import orjson
+import pytest
+
+from gent_disagreement_rag.core import TranscriptFormatter, transcript_fomatter
+
+SAMPLE_TRANSCRIPT = Path(__file__).parent.parent / "fixtures" / "sample_transcript.json"
+SPEAKERS_MAP = {"0": "Ricky Ghoshroy", "1": "Brendan Kelly"}
+
+
+def write_transcript(path: Path, paragraphs: list) -> Path:
+    """Write a minimal Deepgram response holding the given paragraphs."""
+    path.write_bytes(
+        orjson.dumps(
+            {
+                "metadata": {"request_id": "test"},
+                "results": {
+                    "channels": [
+                        {
+                            "alternatives": [
+                                {
+                                    "transcript": "ignored",
+                                    "words": [{"word": "ignored", "start": 0.0}],
+                                    "paragraphs": {"paragraphs": paragraphs},
+                                }
+                            ]
+                        }
+                    ]
+                },
+            }
+        )
+    )
+    return path
+
+
+def paragraph(speaker, *sentences):
+    return {
+        "speaker": speaker,
+        "start": 0.0,
+        "end": 1.0,
+        "sentences": [{"text": text, "start": 0.0, "end": 1.0} for text in sentences],
+    }
+
+
+class TestTranscriptFormatter:
+    """Test suite for TranscriptFormatter."""
+
+    @pytest.fixture
+    def formatter(self, monkeypatch):
+        """Formatter without a segment cache."""
+        monkeypatch.delenv("TRANSCRIPT_FORMATTER_CACHE_DIR", raising=False)
+        return TranscriptFormatter()
+
+    # ===== FORMATTING TESTS =====
+
+    def test_format_segments_sample_transcript(self, formatter):
+        """Test the segments produced for the recorded Deepgram response."""
+        segments = formatter.format_segments(SAMPLE_TRANSCRIPT, SPEAKERS_MAP)
+
+        assert segments == [
+            {
+                "speaker": "Ricky Ghoshroy",
+                "text": "Hello everyone and welcome back to A Gentleman's Disagreement. "
+                "I'm Ricky Ghoshroy and I'm joined today by Brendan Kelly. "
+                "How are you doing today Brendan?",
+            },
+            {
+                "speaker": "Brendan Kelly",
+                "text": "I'm doing great Ricky, thanks for having me on the show again. "
+                "It's always a pleasure to discuss these fascinating topics with you.",
+            },
+        ]
+
+    def test_iter_segments_matches_format_segments(self, formatter, sample_transcript_file):
+        """Test that the streaming and list APIs produce the same segments."""
+        assert list(
+            formatter.iter_segments(sample_transcript_file, SPEAKERS_MAP)
+        ) == formatter.format_segments(sample_transcript_file, SPEAKERS_MAP)
+
+    @pytest.mark.parametrize("first, second", [(0, 1), ("0", "1")])
+    def test_int_and_str_speaker_ids(self, formatter, tmp_path, first, second):
+        """Test that Deepgram's int speaker ids and string ids map the same way."""
+        transcript = write_transcript(
+            tmp_path / "raw.json",
+            [
+                paragraph(first, "Hello."),
+                paragraph(first, "Still me."),
+                paragraph(second, "Hi there."),
+            ],
+        )
+
+        assert formatter.format_segments(transcript, SPEAKERS_MAP) == [
+            {"speaker": "Ricky Ghoshroy", "text": "Hello. Still me."},
+            {"speaker": "Brendan Kelly", "text": "Hi there."},
+        ]
+
+    def test_unmapped_speaker_gets_default_name(self, formatter, tmp_path):
+        """Test that speakers missing from the map are labelled by id."""
+        transcript = write_transcript(tmp_path / "raw.json", [paragraph(2, "Who am I?")])
+
+        assert formatter.format_segments(transcript, SPEAKERS_MAP) == [
+            {"speaker": "Speaker 2", "text": "Who am I?"}
+        ]
+
+    def test_empty_segments_are_dropped(self, formatter, tmp_path):
+        """Test that segments with no text after joining are not returned."""
+        transcript = write_transcript(
+            tmp_path / "raw.json",
+            [
+                paragraph(0, " "),
+                paragraph(1, "Real content."),
+                paragraph(0),
+                paragraph(1, ""),
+            ],
+        )
+
+        assert list(formatter.iter_segments(transcript, SPEAKERS_MAP)) == [
+            {"speaker": "Brendan Kelly", "text": "Real content."}
+        ]
+
+    # ===== SEGMENT CACHE TESTS =====
+
+    @pytest.fixture
+    def cached_formatter(self, tmp_path):
+        """Formatter with an on-disk segment cache."""
+        return TranscriptFormatter(cache_dir=tmp_path / "cache")
+
+    def _tamper_with_cache(self, formatter, segments):
+        """Overwrite every cached entry so a cache hit is recognisable."""
+        for cache_file in formatter.cache_dir.iterdir():
+            cache_file.write_bytes(orjson.dumps(segments))
+
+    def test_cached_segments_are_reused(self, cached_formatter):
+        """Test that a second format of the same transcript reads the cache."""
+        cached_formatter.format_segments(SAMPLE_TRANSCRIPT, SPEAKERS_MAP)
+        self._tamper_with_cache(cached_formatter, [{"speaker": "x", "text": "cached"}])
+
+        assert cached_formatter.format_segments(SAMPLE_TRANSCRIPT, SPEAKERS_MAP) == [
+            {"speaker": "x", "text": "cached"}
+        ]
+
+    def test_format_version_change_invalidates_cache(
+        self, cached_formatter, monkeypatch
+    ):
+        """Test that segments cached by an older format version are not served."""
+        expected = cached_formatter.format_segments(SAMPLE_TRANSCRIPT, SPEAKERS_MAP)
+        self._tamper_with_cache(cached_formatter, [{"speaker": "x", "text": "stale"}])
+
+        monkeypatch.setattr(
+            transcript_fomatter,
+            "SEGMENT_FORMAT_VERSION",
+            transcript_fomatter.SEGMENT_FORMAT_VERSION + 1,
+        )
+
+        assert (
+            cached_formatter.format_segments(SAMPLE_TRANSCRIPT, SPEAKERS_MAP) == expected
+        )
+
+    def test_malformed_transcript_raises(self, formatter, tmp_path):
+        """Test that a response without paragraphs is rejected."""
+        transcript = tmp_path / "raw.json"
+        transcript.write_text('{"results": {}}')
+
+        with pytest.raises(msgspec.ValidationError):
+            formatter.format_segments(transcript, SPEAKERS_MAP)